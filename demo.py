@@ -5,7 +5,6 @@ Demonstrates basic usage of the maze solver
 
 from src.maze import Maze
 from src.algorithms import PathfindingAlgorithms
-from src.dashboard import AnalyticsDashboard
 
 
 def quick_demo():
@@ -64,8 +63,10 @@ def quick_demo():
     print(f"  A* was {(bfs_metrics.execution_time - astar_metrics.execution_time):.3f} ms faster!")
     print(f"  Both found optimal paths of length {bfs_metrics.path_length}")
     
-    # Create dashboard
+    # Create dashboard (imported here so the demo's first steps don't
+    # wait on the ~400 ms matplotlib import)
     print("\nStep 5: Generating comparison chart...")
+    from src.dashboard import AnalyticsDashboard
     dashboard = AnalyticsDashboard()
     dashboard.add_metrics(bfs_metrics)
     dashboard.add_metrics(astar_metrics)
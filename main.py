@@ -5,8 +5,6 @@ Runs the GUI-based maze solver
 import sys
 import argparse
 from src.maze import Maze
-from src.visualizer import MazeVisualizer
-from src.console_solver import run_console_solver, interactive_console_mode
 
 
 def main():
@@ -32,13 +30,17 @@ Examples:
     
     args = parser.parse_args()
     
+    # Heavy imports (pygame for the GUI, matplotlib via the console
+    # dashboard) are deferred until the chosen mode actually needs them
     if args.console:
         # Console mode
         print("\nStarting console mode...\n")
+        from src.console_solver import run_console_solver
         run_console_solver()
     elif args.interactive:
         # Interactive console mode
         print("\nStarting interactive mode...\n")
+        from src.console_solver import interactive_console_mode
         interactive_console_mode()
     else:
         # GUI mode
@@ -66,11 +68,13 @@ Examples:
         
         # Create and run visualizer
         try:
+            from src.visualizer import MazeVisualizer
             visualizer = MazeVisualizer(maze, cell_size=min(30, 800 // max(rows, cols)))
             visualizer.run()
         except Exception as e:
             print(f"\nError running visualizer: {e}")
             print("Falling back to console mode...\n")
+            from src.console_solver import run_console_solver
             run_console_solver()
 
 
@@ -0,0 +1,34 @@
+"""
+Build Script
+Compiles the optional Cython kernels (src/_bfs.pyx, src/_astar.pyx)
+
+Usage:
+    python setup.py build_ext --inplace
+
+The solver works without them: algorithms fall back to the numba
+kernels or the pure-Python loops when the extensions are not built.
+"""
+from setuptools import setup, Extension
+
+try:
+    from Cython.Build import cythonize
+    import numpy as np
+    extensions = cythonize(
+        [Extension('src._bfs', ['src/_bfs.pyx'],
+                   include_dirs=[np.get_include()]),
+         Extension('src._astar', ['src/_astar.pyx'],
+                   include_dirs=[np.get_include()])],
+        language_level=3
+    )
+except ImportError:
+    # Cython (or numpy) not installed: skip the optional extension
+    extensions = []
+
+setup(
+    name='ai-maze-solver',
+    version='1.0.0',
+    description='AI-Based Maze Solver - Pathfinding Algorithm Comparison',
+    packages=['src'],
+    ext_modules=extensions,
+    python_requires='>=3.10',
+)
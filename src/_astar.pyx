@@ -0,0 +1,177 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython A* / Dijkstra Kernel
+C-compiled indexed-heap search for users who skip the numba dependency;
+unlike the JIT kernels it is fast on the very first call
+"""
+import numpy as np
+cimport numpy as cnp
+from libc.math cimport sqrt
+
+# Must match CellType.WALL.value in src.maze
+DEF WALL = 1
+
+# Heuristic codes (must match src._kernels)
+DEF H_MANHATTAN = 0
+DEF H_EUCLIDEAN = 1
+DEF H_CHEBYSHEV = 2
+DEF H_ZERO = -1
+
+# Sentinel values for the indexed heap's position array
+DEF NOT_IN_HEAP = -1
+DEF POPPED = -2
+
+
+cdef inline double _heur(int r, int c, int er, int ec, int code) nogil:
+    """Compute heuristic distance from (r, c) to (er, ec)"""
+    cdef int dr = r - er
+    cdef int dc = c - ec
+    if dr < 0:
+        dr = -dr
+    if dc < 0:
+        dc = -dc
+    if code == H_EUCLIDEAN:
+        return sqrt(<double>(dr * dr + dc * dc))
+    if code == H_CHEBYSHEV:
+        return <double>(dr if dr > dc else dc)
+    if code == H_ZERO:
+        return 0.0
+    return <double>(dr + dc)
+
+
+cdef inline void _sift_up(cnp.int32_t[::1] heap_v, cnp.int32_t[::1] pos,
+                          cnp.float64_t[::1] keys, int i) nogil:
+    """Restore heap order upward from slot i (indexed 4-ary heap)"""
+    cdef int p
+    cdef cnp.int32_t tmp
+    while i > 0:
+        p = (i - 1) / 4
+        if keys[heap_v[p]] <= keys[heap_v[i]]:
+            break
+        tmp = heap_v[p]
+        heap_v[p] = heap_v[i]
+        heap_v[i] = tmp
+        pos[heap_v[p]] = p
+        pos[heap_v[i]] = i
+        i = p
+
+
+cdef inline void _sift_down(cnp.int32_t[::1] heap_v, cnp.int32_t[::1] pos,
+                            cnp.float64_t[::1] keys, int size, int i) nogil:
+    """Restore heap order downward from slot i (indexed 4-ary heap)"""
+    cdef int first, last, child, smallest
+    cdef cnp.int32_t tmp
+    while True:
+        first = 4 * i + 1
+        smallest = i
+        last = first + 4
+        if last > size:
+            last = size
+        for child in range(first, last):
+            if keys[heap_v[child]] < keys[heap_v[smallest]]:
+                smallest = child
+        if smallest == i:
+            break
+        tmp = heap_v[smallest]
+        heap_v[smallest] = heap_v[i]
+        heap_v[i] = tmp
+        pos[heap_v[smallest]] = smallest
+        pos[heap_v[i]] = i
+        i = smallest
+
+
+def astar_c(cnp.int8_t[:, ::1] grid, int sr, int sc, int er, int ec, int h_code):
+    """
+    A* search over a contiguous int8 grid (Dijkstra when h_code == -1)
+
+    Same indexed 4-ary decrease-key heap as src._kernels.astar_kernel:
+    each cell sits in the heap at most once and relaxations update it in
+    place, so no tombstone entries or pop-time skip checks are needed.
+
+    Returns:
+        (parent, nodes_explored, max_frontier, found) matching the
+        signature of src._kernels.astar_kernel
+    """
+    cdef int rows = grid.shape[0]
+    cdef int cols = grid.shape[1]
+    cdef int n = rows * cols
+
+    parent_arr = np.full(n, -1, dtype=np.int32)
+    g_arr = np.full(n, np.inf, dtype=np.float64)
+    keys_arr = np.full(n, np.inf, dtype=np.float64)
+    heap_arr = np.empty(n, dtype=np.int32)
+    pos_arr = np.full(n, NOT_IN_HEAP, dtype=np.int32)
+
+    cdef cnp.int32_t[::1] parent = parent_arr
+    cdef cnp.float64_t[::1] g_score = g_arr
+    cdef cnp.float64_t[::1] keys = keys_arr
+    cdef cnp.int32_t[::1] heap_v = heap_arr
+    cdef cnp.int32_t[::1] pos = pos_arr
+
+    cdef int size = 0
+    cdef int start = sr * cols + sc
+    cdef int goal = er * cols + ec
+    cdef int nodes = 0
+    cdef int max_frontier = 0
+    cdef int current, r, c, nr, nc, neighbor, k
+    cdef double new_g
+    cdef bint found = False
+
+    g_score[start] = 0.0
+    keys[start] = _heur(sr, sc, er, ec, h_code)
+    heap_v[0] = start
+    pos[start] = 0
+    size = 1
+
+    with nogil:
+        while size > 0:
+            if size > max_frontier:
+                max_frontier = size
+            current = heap_v[0]
+            pos[current] = POPPED
+            size -= 1
+            if size > 0:
+                heap_v[0] = heap_v[size]
+                pos[heap_v[0]] = 0
+                _sift_down(heap_v, pos, keys, size, 0)
+            nodes += 1
+
+            if current == goal:
+                found = True
+                break
+
+            r = current / cols
+            c = current - r * cols
+            new_g = g_score[current] + 1.0
+
+            # Unrolled 4-neighbor checks: up, down, left, right
+            for k in range(4):
+                if k == 0:
+                    nr = r - 1; nc = c
+                elif k == 1:
+                    nr = r + 1; nc = c
+                elif k == 2:
+                    nr = r; nc = c - 1
+                else:
+                    nr = r; nc = c + 1
+                if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL:
+                    neighbor = nr * cols + nc
+                    if new_g < g_score[neighbor]:
+                        g_score[neighbor] = new_g
+                        parent[neighbor] = current
+                        keys[neighbor] = new_g + _heur(nr, nc, er, ec, h_code)
+                        if pos[neighbor] == NOT_IN_HEAP:
+                            heap_v[size] = neighbor
+                            pos[neighbor] = size
+                            size += 1
+                            _sift_up(heap_v, pos, keys, size - 1)
+                        else:
+                            # Decrease-key: f only ever improves here
+                            _sift_up(heap_v, pos, keys, pos[neighbor])
+
+    return parent_arr, nodes, max_frontier, found
+
+
+def dijkstra_c(cnp.int8_t[:, ::1] grid, int sr, int sc, int er, int ec):
+    """Dijkstra over a contiguous int8 grid (A* with a zero heuristic)"""
+    return astar_c(grid, sr, sc, er, ec, H_ZERO)
@@ -0,0 +1,80 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython BFS Kernel
+C-compiled 4-neighbor BFS for users who skip the numba dependency;
+unlike the JIT kernels it is fast on the very first call
+"""
+import numpy as np
+cimport numpy as cnp
+
+# Must match CellType.WALL.value in src.maze
+DEF WALL = 1
+
+
+def bfs_c(cnp.int8_t[:, ::1] grid, int sr, int sc, int er, int ec):
+    """
+    Breadth-First Search over a contiguous int8 grid
+
+    Returns:
+        (parent, nodes_explored, max_frontier, found) matching the
+        signature of src._kernels.bfs_kernel
+    """
+    cdef int rows = grid.shape[0]
+    cdef int cols = grid.shape[1]
+    cdef int n = rows * cols
+
+    parent_arr = np.full(n, -1, dtype=np.int32)
+    visited_arr = np.zeros(n, dtype=np.uint8)
+    queue_arr = np.empty(n, dtype=np.int32)
+
+    cdef cnp.int32_t[::1] parent = parent_arr
+    cdef cnp.uint8_t[::1] visited = visited_arr
+    cdef cnp.int32_t[::1] queue = queue_arr
+
+    cdef int head = 0
+    cdef int tail = 0
+    cdef int start = sr * cols + sc
+    cdef int goal = er * cols + ec
+    cdef int nodes = 0
+    cdef int max_frontier = 0
+    cdef int current, r, c, nr, nc, neighbor, k
+    cdef bint found = False
+
+    queue[tail] = start
+    tail += 1
+    visited[start] = 1
+
+    with nogil:
+        while head < tail:
+            if tail - head > max_frontier:
+                max_frontier = tail - head
+            current = queue[head]
+            head += 1
+            nodes += 1
+
+            if current == goal:
+                found = True
+                break
+
+            r = current / cols
+            c = current - r * cols
+
+            # Unrolled 4-neighbor checks: up, down, left, right
+            for k in range(4):
+                if k == 0:
+                    nr = r - 1; nc = c
+                elif k == 1:
+                    nr = r + 1; nc = c
+                elif k == 2:
+                    nr = r; nc = c - 1
+                else:
+                    nr = r; nc = c + 1
+                if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL:
+                    neighbor = nr * cols + nc
+                    if visited[neighbor] == 0:
+                        visited[neighbor] = 1
+                        parent[neighbor] = current
+                        queue[tail] = neighbor
+                        tail += 1
+
+    return parent_arr, nodes, max_frontier, found
@@ -0,0 +1,682 @@
+"""
+Compiled Search Kernels Module
+Numba-accelerated inner loops for DFS, BFS, Dijkstra, A*, Greedy
+Best-First, and JPS on a flat int8 grid
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator so the kernels still run (slowly) without numba"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Must match CellType.WALL.value in src.maze (kept as a plain int so the
+# kernels stay free of Python enum access)
+WALL = 1
+
+# Heuristic codes for astar_kernel
+H_MANHATTAN = 0
+H_EUCLIDEAN = 1
+H_CHEBYSHEV = 2
+H_ZERO = -1  # Dijkstra: no heuristic
+
+
+@njit(cache=True)
+def _bit_get(bits, i):
+    """Test bit i of a uint64-lane bitmap"""
+    return (bits[i >> 6] >> np.uint64(i & 63)) & np.uint64(1)
+
+
+@njit(cache=True)
+def _bit_set(bits, i):
+    """Set bit i of a uint64-lane bitmap"""
+    bits[i >> 6] |= np.uint64(1) << np.uint64(i & 63)
+
+
+@njit(cache=True)
+def _heuristic(r: int, c: int, er: int, ec: int, code: int) -> float:
+    """Compute heuristic distance from (r, c) to (er, ec)"""
+    if code == H_EUCLIDEAN:
+        return ((r - er) ** 2 + (c - ec) ** 2) ** 0.5
+    if code == H_CHEBYSHEV:
+        dr = abs(r - er)
+        dc = abs(c - ec)
+        return float(dr if dr > dc else dc)
+    if code == H_ZERO:
+        return 0.0
+    return float(abs(r - er) + abs(c - ec))
+
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_v, size, f, v):
+    """Push (f, v) onto the 4-ary heap; returns new size"""
+    heap_f[size] = f
+    heap_v[size] = v
+    i = size
+    while i > 0:
+        p = (i - 1) // 4
+        if heap_f[p] <= heap_f[i]:
+            break
+        heap_f[p], heap_f[i] = heap_f[i], heap_f[p]
+        heap_v[p], heap_v[i] = heap_v[i], heap_v[p]
+        i = p
+    return size + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_v, size):
+    """Pop the minimum (f, v) from the 4-ary heap; returns (f, v, new size)"""
+    f = heap_f[0]
+    v = heap_v[0]
+    size -= 1
+    heap_f[0] = heap_f[size]
+    heap_v[0] = heap_v[size]
+    i = 0
+    while True:
+        first = 4 * i + 1
+        smallest = i
+        last = first + 4
+        if last > size:
+            last = size
+        for child in range(first, last):
+            if heap_f[child] < heap_f[smallest]:
+                smallest = child
+        if smallest == i:
+            break
+        heap_f[smallest], heap_f[i] = heap_f[i], heap_f[smallest]
+        heap_v[smallest], heap_v[i] = heap_v[i], heap_v[smallest]
+        i = smallest
+    return f, v, size
+
+
+@njit(cache=True)
+def bfs_kernel(grid, sr, sc, er, ec):
+    """
+    Breadth-First Search over a flat int8 grid
+
+    Returns:
+        (parent, nodes_explored, max_frontier, found) where parent is a
+        flat int32 array mapping each cell index to its predecessor
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+    parent = np.full(n, -1, np.int32)
+    # Bit-packed visited map: one bit per cell, 64 cells per lane
+    visited = np.zeros((n + 63) // 64, np.uint64)
+    queue = np.empty(n, np.int32)
+    head = 0
+    tail = 0
+    start = sr * cols + sc
+    goal = er * cols + ec
+    queue[tail] = start
+    tail += 1
+    _bit_set(visited, start)
+    nodes = 0
+    max_frontier = 0
+    found = False
+
+    while head < tail:
+        if tail - head > max_frontier:
+            max_frontier = tail - head
+        current = queue[head]
+        head += 1
+        nodes += 1
+
+        if current == goal:
+            found = True
+            break
+
+        r = current // cols
+        c = current % cols
+
+        # Hard-coded 4-neighbor offsets: up, down, left, right. The
+        # bounds checks stay: border cells are legal here (the default
+        # start is (0, 0)), so a sentinel wall border is not an option
+        for k in range(4):
+            if k == 0:
+                nr, nc = r - 1, c
+            elif k == 1:
+                nr, nc = r + 1, c
+            elif k == 2:
+                nr, nc = r, c - 1
+            else:
+                nr, nc = r, c + 1
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL:
+                neighbor = nr * cols + nc
+                if _bit_get(visited, neighbor) == 0:
+                    _bit_set(visited, neighbor)
+                    parent[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
+
+    return parent, nodes, max_frontier, found
+
+
+@njit(cache=True)
+def dfs_kernel(grid, sr, sc, er, ec):
+    """
+    Depth-First Search over a flat int8 grid
+
+    Mirrors the Python stack loop: neighbors are pushed in
+    up/down/left/right order and marked visited at push time, so the
+    exploration order (and thus the returned path) matches.
+
+    Returns:
+        (parent, nodes_explored, max_frontier, found)
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+    parent = np.full(n, -1, np.int32)
+    # Bit-packed visited map: one bit per cell, 64 cells per lane
+    visited = np.zeros((n + 63) // 64, np.uint64)
+    stack = np.empty(n, np.int32)
+    start = sr * cols + sc
+    goal = er * cols + ec
+    stack[0] = start
+    top = 1
+    _bit_set(visited, start)
+    nodes = 0
+    max_frontier = 0
+    found = False
+
+    while top > 0:
+        if top > max_frontier:
+            max_frontier = top
+        top -= 1
+        current = stack[top]
+        nodes += 1
+
+        if current == goal:
+            found = True
+            break
+
+        r = current // cols
+        c = current % cols
+
+        for k in range(4):
+            if k == 0:
+                nr, nc = r - 1, c
+            elif k == 1:
+                nr, nc = r + 1, c
+            elif k == 2:
+                nr, nc = r, c - 1
+            else:
+                nr, nc = r, c + 1
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL:
+                neighbor = nr * cols + nc
+                if _bit_get(visited, neighbor) == 0:
+                    _bit_set(visited, neighbor)
+                    parent[neighbor] = current
+                    stack[top] = neighbor
+                    top += 1
+
+    return parent, nodes, max_frontier, found
+
+
+@njit(cache=True)
+def greedy_kernel(grid, sr, sc, er, ec, h_code):
+    """
+    Greedy Best-First Search over a flat int8 grid
+
+    Orders the frontier purely by heuristic distance to the goal; like
+    the Python loop it records each cell's latest predecessor and skips
+    stale heap entries at pop time.
+
+    Returns:
+        (parent, nodes_explored, max_frontier, found)
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+    parent = np.full(n, -1, np.int32)
+    # Bit-packed closed map: one bit per cell, 64 cells per lane
+    closed = np.zeros((n + 63) // 64, np.uint64)
+
+    # Each cell can be pushed once per incoming edge
+    heap_f = np.empty(4 * n + 4, np.float64)
+    heap_v = np.empty(4 * n + 4, np.int32)
+    size = 0
+
+    start = sr * cols + sc
+    goal = er * cols + ec
+    size = _heap_push(heap_f, heap_v, size,
+                      _heuristic(sr, sc, er, ec, h_code), start)
+    nodes = 0
+    max_frontier = 0
+    found = False
+
+    while size > 0:
+        if size > max_frontier:
+            max_frontier = size
+        h, current, size = _heap_pop(heap_f, heap_v, size)
+
+        if _bit_get(closed, current) == 1:
+            continue
+        _bit_set(closed, current)
+        nodes += 1
+
+        if current == goal:
+            found = True
+            break
+
+        r = current // cols
+        c = current % cols
+
+        for k in range(4):
+            if k == 0:
+                nr, nc = r - 1, c
+            elif k == 1:
+                nr, nc = r + 1, c
+            elif k == 2:
+                nr, nc = r, c - 1
+            else:
+                nr, nc = r, c + 1
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL:
+                neighbor = nr * cols + nc
+                if _bit_get(closed, neighbor) == 0:
+                    size = _heap_push(heap_f, heap_v, size,
+                                      _heuristic(nr, nc, er, ec, h_code),
+                                      neighbor)
+                    # Unconditional: parents always point at an already-
+                    # expanded node, so the chain stays acyclic
+                    parent[neighbor] = current
+
+    return parent, nodes, max_frontier, found
+
+
+# Sentinel values for the indexed heap's position array
+_NOT_IN_HEAP = -1
+_POPPED = -2
+
+
+@njit(cache=True)
+def _iheap_sift_up(heap_v, pos, keys, i):
+    """Restore heap order upward from slot i (indexed 4-ary heap)"""
+    while i > 0:
+        p = (i - 1) // 4
+        if keys[heap_v[p]] <= keys[heap_v[i]]:
+            break
+        heap_v[p], heap_v[i] = heap_v[i], heap_v[p]
+        pos[heap_v[p]] = p
+        pos[heap_v[i]] = i
+        i = p
+
+
+@njit(cache=True)
+def _iheap_sift_down(heap_v, pos, keys, size, i):
+    """Restore heap order downward from slot i (indexed 4-ary heap)"""
+    while True:
+        first = 4 * i + 1
+        smallest = i
+        last = first + 4
+        if last > size:
+            last = size
+        for child in range(first, last):
+            if keys[heap_v[child]] < keys[heap_v[smallest]]:
+                smallest = child
+        if smallest == i:
+            break
+        heap_v[smallest], heap_v[i] = heap_v[i], heap_v[smallest]
+        pos[heap_v[smallest]] = smallest
+        pos[heap_v[i]] = i
+        i = smallest
+
+
+@njit(cache=True)
+def astar_kernel(grid, sr, sc, er, ec, h_code):
+    """
+    A* search over a flat int8 grid (Dijkstra when h_code == H_ZERO)
+
+    The priority queue is an indexed 4-ary heap: shallower than a binary
+    heap with better cache behavior per level, and a position array gives
+    O(1) decrease-key, so relaxations update a node in place instead of
+    pushing tombstone duplicates. Each cell therefore appears in the heap
+    at most once and the pop loop needs no skip check.
+
+    Returns:
+        (parent, nodes_explored, max_frontier, found)
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+    parent = np.full(n, -1, np.int32)
+    g_score = np.full(n, np.inf, np.float64)
+
+    # Indexed heap: node ids ordered by f-score, pos[node] -> heap slot.
+    # Capacity n is exact — decrease-key keeps each cell in the heap at
+    # most once, so there is no resize path
+    keys = np.full(n, np.inf, np.float64)
+    heap_v = np.empty(n, np.int32)
+    pos = np.full(n, _NOT_IN_HEAP, np.int32)
+    size = 0
+
+    start = sr * cols + sc
+    goal = er * cols + ec
+    g_score[start] = 0.0
+    keys[start] = _heuristic(sr, sc, er, ec, h_code)
+    heap_v[0] = start
+    pos[start] = 0
+    size = 1
+    nodes = 0
+    max_frontier = 0
+    found = False
+
+    while size > 0:
+        if size > max_frontier:
+            max_frontier = size
+        current = heap_v[0]
+        pos[current] = _POPPED
+        size -= 1
+        if size > 0:
+            heap_v[0] = heap_v[size]
+            pos[heap_v[0]] = 0
+            _iheap_sift_down(heap_v, pos, keys, size, 0)
+        nodes += 1
+
+        if current == goal:
+            found = True
+            break
+
+        r = current // cols
+        c = current % cols
+        new_g = g_score[current] + 1.0
+
+        for k in range(4):
+            if k == 0:
+                nr, nc = r - 1, c
+            elif k == 1:
+                nr, nc = r + 1, c
+            elif k == 2:
+                nr, nc = r, c - 1
+            else:
+                nr, nc = r, c + 1
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL:
+                neighbor = nr * cols + nc
+                if new_g < g_score[neighbor]:
+                    g_score[neighbor] = new_g
+                    parent[neighbor] = current
+                    keys[neighbor] = new_g + _heuristic(nr, nc, er, ec, h_code)
+                    if pos[neighbor] == _NOT_IN_HEAP:
+                        heap_v[size] = neighbor
+                        pos[neighbor] = size
+                        size += 1
+                        _iheap_sift_up(heap_v, pos, keys, size - 1)
+                    else:
+                        # Decrease-key: f only ever improves here
+                        _iheap_sift_up(heap_v, pos, keys, pos[neighbor])
+
+    return parent, nodes, max_frontier, found
+
+
+@njit(cache=True)
+def dijkstra_kernel(grid, sr, sc, er, ec):
+    """Dijkstra over a flat int8 grid (A* with a zero heuristic)"""
+    return astar_kernel(grid, sr, sc, er, ec, H_ZERO)
+
+
+@njit(cache=True)
+def _free(grid, r, c):
+    """Whether (r, c) is in bounds and not a wall"""
+    rows, cols = grid.shape
+    return 0 <= r < rows and 0 <= c < cols and grid[r, c] != WALL
+
+
+@njit(cache=True)
+def _jump_vertical(grid, r, c, dr, er, ec):
+    """
+    Scan vertically from (r, c) in direction dr until a jump point
+
+    A cell is a jump point if it is the goal or has a forced neighbor:
+    a free horizontal neighbor whose cell behind us is blocked, meaning
+    the turn could not have been taken earlier.
+
+    Returns the flat index of the jump point, or -1
+    """
+    rows, cols = grid.shape
+    while True:
+        r += dr
+        if not _free(grid, r, c):
+            return -1
+        if r == er and c == ec:
+            return r * cols + c
+        # Forced neighbor checks on both sides
+        if _free(grid, r, c + 1) and not _free(grid, r - dr, c + 1):
+            return r * cols + c
+        if _free(grid, r, c - 1) and not _free(grid, r - dr, c - 1):
+            return r * cols + c
+
+
+@njit(cache=True)
+def _jump_horizontal(grid, r, c, dc, er, ec):
+    """
+    Scan horizontally from (r, c) in direction dc until a jump point
+
+    Horizontal scans also probe vertically at every step (the 4-connected
+    analogue of the diagonal case in classic JPS), so turns that pay off
+    further up or down the column stop the scan here.
+
+    Returns the flat index of the jump point, or -1
+    """
+    rows, cols = grid.shape
+    while True:
+        c += dc
+        if not _free(grid, r, c):
+            return -1
+        if r == er and c == ec:
+            return r * cols + c
+        # Forced neighbor checks above and below
+        if _free(grid, r + 1, c) and not _free(grid, r + 1, c - dc):
+            return r * cols + c
+        if _free(grid, r - 1, c) and not _free(grid, r - 1, c - dc):
+            return r * cols + c
+        # Stop where a vertical jump from this column would succeed
+        if _jump_vertical(grid, r, c, 1, er, ec) != -1:
+            return r * cols + c
+        if _jump_vertical(grid, r, c, -1, er, ec) != -1:
+            return r * cols + c
+
+
+@njit(cache=True)
+def jps_kernel(grid, sr, sc, er, ec):
+    """
+    Jump Point Search over a flat int8 grid (4-connected variant)
+
+    Expands only jump points; straight corridor cells between them are
+    skipped entirely. Edge costs between jump points equal the Manhattan
+    distance, so paths are optimal as with A*.
+
+    Returns:
+        (parent, nodes_explored, max_frontier, found) where parent links
+        jump points (callers interpolate the straight segments)
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+    parent = np.full(n, -1, np.int32)
+    g_score = np.full(n, np.inf, np.float64)
+    # Bit-packed closed map: one bit per cell, 64 cells per lane
+    closed = np.zeros((n + 63) // 64, np.uint64)
+
+    # Worst case one push per incoming edge, so 4n + 4 never resizes
+    heap_f = np.empty(4 * n + 4, np.float64)
+    heap_v = np.empty(4 * n + 4, np.int32)
+    size = 0
+
+    start = sr * cols + sc
+    goal = er * cols + ec
+    g_score[start] = 0.0
+    size = _heap_push(heap_f, heap_v, size,
+                      _heuristic(sr, sc, er, ec, H_MANHATTAN), start)
+    nodes = 0
+    max_frontier = 0
+    found = False
+
+    while size > 0:
+        if size > max_frontier:
+            max_frontier = size
+        f, current, size = _heap_pop(heap_f, heap_v, size)
+
+        if _bit_get(closed, current) == 1:
+            continue
+        _bit_set(closed, current)
+        nodes += 1
+
+        if current == goal:
+            found = True
+            break
+
+        r = current // cols
+        c = current % cols
+        g = g_score[current]
+
+        # Probe all four directions for the next jump point
+        for k in range(4):
+            if k == 0:
+                jp = _jump_vertical(grid, r, c, -1, er, ec)
+            elif k == 1:
+                jp = _jump_vertical(grid, r, c, 1, er, ec)
+            elif k == 2:
+                jp = _jump_horizontal(grid, r, c, -1, er, ec)
+            else:
+                jp = _jump_horizontal(grid, r, c, 1, er, ec)
+            if jp == -1:
+                continue
+            jr = jp // cols
+            jc = jp % cols
+            new_g = g + abs(jr - r) + abs(jc - c)
+            if new_g < g_score[jp]:
+                g_score[jp] = new_g
+                parent[jp] = current
+                size = _heap_push(
+                    heap_f, heap_v, size,
+                    new_g + _heuristic(jr, jc, er, ec, H_MANHATTAN),
+                    jp)
+
+    return parent, nodes, max_frontier, found
+
+
+@njit(cache=True)
+def csr_kernel(grid):
+    """
+    Build CSR adjacency arrays for the maze graph in one compiled pass
+
+    Neighbors of flat cell index i are indices[indptr[i]:indptr[i + 1]];
+    walls get empty ranges. Edge order matches Maze.get_neighbors
+    (up, down, left, right).
+
+    Returns:
+        (indptr: int32[N + 1], indices: int32[E])
+    """
+    rows, cols = grid.shape
+    n = rows * cols
+    indptr = np.empty(n + 1, np.int32)
+    # At most 4 edges per cell; trimmed to the real count at the end
+    indices = np.empty(4 * n, np.int32)
+    e = 0
+    indptr[0] = 0
+    for r in range(rows):
+        for c in range(cols):
+            if grid[r, c] != WALL:
+                for k in range(4):
+                    if k == 0:
+                        nr, nc = r - 1, c
+                    elif k == 1:
+                        nr, nc = r + 1, c
+                    elif k == 2:
+                        nr, nc = r, c - 1
+                    else:
+                        nr, nc = r, c + 1
+                    if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != WALL:
+                        indices[e] = nr * cols + nc
+                        e += 1
+            indptr[r * cols + c + 1] = e
+    return indptr, indices[:e].copy()
+
+
+@njit(cache=True)
+def carve_kernel(grid, seed):
+    """
+    Iterative DFS maze carver over an int8 grid (edits it in place)
+
+    Replaces the recursive backtracker: an explicit stack removes the
+    recursion-limit ceiling on large mazes and the loop compiles. The
+    stack top picks a random still-walled cell two steps away, carves
+    the wall between them and pushes it, popping to backtrack when no
+    candidates remain. Produces the same class of perfect maze as the
+    recursive version (exact layout differs per RNG stream).
+    """
+    np.random.seed(seed)
+    rows, cols = grid.shape
+    stack = np.empty(rows * cols, np.int32)
+    grid[1, 1] = 0  # CellType.EMPTY.value
+    stack[0] = cols + 1
+    top = 1
+    cand = np.empty(4, np.int32)
+
+    while top > 0:
+        current = stack[top - 1]
+        r = current // cols
+        c = current % cols
+
+        # Collect still-walled cells two steps away (up, down, left, right)
+        k = 0
+        for d in range(4):
+            if d == 0:
+                nr, nc = r - 2, c
+            elif d == 1:
+                nr, nc = r + 2, c
+            elif d == 2:
+                nr, nc = r, c - 2
+            else:
+                nr, nc = r, c + 2
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] == WALL:
+                cand[k] = d
+                k += 1
+
+        if k == 0:
+            top -= 1
+            continue
+
+        d = cand[np.random.randint(k)]
+        if d == 0:
+            nr, nc = r - 2, c
+        elif d == 1:
+            nr, nc = r + 2, c
+        elif d == 2:
+            nr, nc = r, c - 2
+        else:
+            nr, nc = r, c + 2
+
+        # Carve the wall between and the target cell, then walk into it
+        grid[(r + nr) // 2, (c + nc) // 2] = 0
+        grid[nr, nc] = 0
+        stack[top] = nr * cols + nc
+        top += 1
+
+
+def _warm_kernels():
+    """Compile every kernel once on a tiny grid at import time
+
+    First-call JIT compilation would otherwise land inside a solver's
+    timed region and be reported as that algorithm's execution time
+    and memory; cache=True only skips the compile once the on-disk
+    cache exists, not on a fresh machine. A 5x5 warm-up keeps the cost
+    out of every tracked run.
+    """
+    grid = np.zeros((5, 5), np.int8)
+    bfs_kernel(grid, 0, 0, 4, 4)
+    dfs_kernel(grid, 0, 0, 4, 4)
+    greedy_kernel(grid, 0, 0, 4, 4, H_MANHATTAN)
+    astar_kernel(grid, 0, 0, 4, 4, H_EUCLIDEAN)
+    dijkstra_kernel(grid, 0, 0, 4, 4)
+    jps_kernel(grid, 0, 0, 4, 4)
+    csr_kernel(grid)
+    carve_kernel(np.full((5, 5), WALL, np.int8), 0)
+
+
+if HAVE_NUMBA:
+    _warm_kernels()
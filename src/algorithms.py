@@ -2,12 +2,26 @@
 Pathfinding Algorithms Module
 Implements DFS, BFS, Dijkstra, A*, and Greedy Best-First Search
 """
-from typing import List, Tuple, Optional, Callable, Set, Dict
-from collections import deque
+from typing import List, Tuple, Optional, Callable, Dict
+from array import array
 import heapq
 import math
+import numpy as np
 from src.maze import Maze, CellType
 from src.metrics import MetricsTracker, AlgorithmMetrics
+from src import _kernels
+
+try:
+    # Optional Cython extensions (python setup.py build_ext --inplace):
+    # same speed class as the numba kernels but with no JIT warm-up
+    from src import _bfs
+except ImportError:
+    _bfs = None
+
+try:
+    from src import _astar
+except ImportError:
+    _astar = None
 
 
 class PathfindingAlgorithms:
@@ -39,25 +53,60 @@ class PathfindingAlgorithms:
         if self.visualization_callback:
             self.visualization_callback(row, col, state)
     
-    def _reconstruct_path(self, came_from: Dict[Tuple[int, int], Tuple[int, int]], 
-                         current: Tuple[int, int]) -> List[Tuple[int, int]]:
+    def _iter_path(self, came_from: Dict[Tuple[int, int], Tuple[int, int]],
+                   current: Tuple[int, int]):
         """
-        Reconstruct path from start to end using came_from dictionary
-        
+        Yield the path cells from the end back to the start
+
+        Streaming the parent chain lets callers collect the path and feed
+        the visualization callback in one walk instead of materializing
+        the list and iterating it a second time.
+
         Args:
             came_from: Dictionary mapping each node to its predecessor
             current: End node
-            
-        Returns:
-            List of coordinates representing the path
+
+        Yields:
+            Path coordinates in end-to-start order
         """
-        path = [current]
+        yield current
         while current in came_from:
             current = came_from[current]
-            path.append(current)
+            yield current
+
+    def _use_kernel(self) -> bool:
+        """Whether the compiled kernels can replace the Python loops"""
+        return _kernels.HAVE_NUMBA and self.visualization_callback is None
+
+    def _kernel_grid(self) -> 'np.ndarray':
+        """Grid as the contiguous int8 array the kernels operate on"""
+        return np.ascontiguousarray(self.maze.grid, dtype=np.int8)
+
+    def _path_from_parent(self, parent: 'np.ndarray', found: bool) -> List[Tuple[int, int]]:
+        """
+        Reconstruct the path from a kernel's flat parent array
+
+        Args:
+            parent: Flat int32 array mapping cell index -> predecessor index
+            found: Whether the kernel reached the end cell
+
+        Returns:
+            List of coordinates from start to end (empty if not found)
+        """
+        if not found:
+            return []
+        cols = self.maze.cols
+        start = self.maze.start[0] * cols + self.maze.start[1]
+        current = self.maze.end[0] * cols + self.maze.end[1]
+        path = []
+        while current != -1:
+            path.append((current // cols, current % cols))
+            if current == start:
+                break
+            current = int(parent[current])
         path.reverse()
         return path
-    
+
     # ===== DFS (Stack-based) =====
     def dfs(self) -> AlgorithmMetrics:
         """
@@ -74,40 +123,82 @@ class PathfindingAlgorithms:
         
         start = self.maze.start
         end = self.maze.end
-        
-        # Stack for DFS (LIFO)
-        stack = [start]
-        visited: Set[Tuple[int, int]] = {start}
+
+        # Fast path: compiled kernel when no step-by-step visualization
+        if self._use_kernel():
+            parent, nodes, max_frontier, found = _kernels.dfs_kernel(
+                self._kernel_grid(), start[0], start[1], end[0], end[1])
+            tracker.nodes_explored = nodes
+            tracker.update_frontier_size(max_frontier)
+            return tracker.create_metrics(
+                algorithm_name="DFS (Stack)",
+                path=self._path_from_parent(parent, found),
+                time_complexity="O(V + E)",
+                space_complexity="O(V)",
+                is_optimal=False
+            )
+
+        # Neighbor probes inlined below: locals avoid a method call and
+        # list build per expansion
+        grid = self.maze.grid
+        rows, cols = self.maze.rows, self.maze.cols
+        wall = CellType.WALL.value
+        cb = self.visualization_callback
+
+        # Stack for DFS (LIFO): array('i') of flat r * cols + c indices
+        # packs entries into 4 contiguous bytes apiece (no tuple objects),
+        # so even a worst-case stack of rows * cols cells stays cache
+        # resident; visited is a flat dense byte map on the same indexing
+        stack = array('i', (start[0] * cols + start[1],))
+        visited = bytearray(rows * cols)
+        visited[stack[0]] = 1
         came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        
+        end_idx = end[0] * cols + end[1]
+
         found = False
-        
+        nodes = 0
+        max_frontier = 0
+
         while stack:
-            tracker.update_frontier_size(len(stack))
-            current = stack.pop()
-            tracker.increment_nodes()
-            
-            self._visualize_step(current[0], current[1], 'exploring')
-            
-            if current == end:
+            if len(stack) > max_frontier:
+                max_frontier = len(stack)
+            idx = stack.pop()
+            nodes += 1
+            r, c = divmod(idx, cols)
+
+            if cb:
+                cb(r, c, 'exploring')
+
+            if idx == end_idx:
                 found = True
                 break
-            
-            # Explore neighbors
-            for neighbor in self.maze.get_neighbors(current[0], current[1]):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append(neighbor)
+
+            # Explore neighbors (unrolled: up, down, left, right)
+            current = (r, c)
+            for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                nr, nc = neighbor
+                if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                    continue
+                nidx = nr * cols + nc
+                if not visited[nidx]:
+                    visited[nidx] = 1
+                    stack.append(nidx)
                     came_from[neighbor] = current
-                    self._visualize_step(neighbor[0], neighbor[1], 'visited')
+                    if cb:
+                        cb(nr, nc, 'visited')
         
-        # Reconstruct path
+        tracker.nodes_explored = nodes
+        tracker.update_frontier_size(max_frontier)
+
+        # Reconstruct path: collect cells and forward them to the
+        # visualizer in a single walk over the parent chain
         path = []
         if found:
-            path = self._reconstruct_path(came_from, end)
-            for row, col in path:
-                if (row, col) != start and (row, col) != end:
-                    self._visualize_step(row, col, 'path')
+            for cell in self._iter_path(came_from, end):
+                path.append(cell)
+                if cb and cell != start and cell != end:
+                    cb(cell[0], cell[1], 'path')
+            path.reverse()
         
         return tracker.create_metrics(
             algorithm_name="DFS (Stack)",
@@ -133,40 +224,94 @@ class PathfindingAlgorithms:
         
         start = self.maze.start
         end = self.maze.end
-        
-        # Queue for BFS (FIFO)
-        queue = deque([start])
-        visited: Set[Tuple[int, int]] = {start}
+
+        # Fast path: compiled kernel when no step-by-step visualization
+        # (the Cython extension wins on first call since it needs no JIT)
+        if _bfs is not None and self.visualization_callback is None:
+            parent, nodes, max_frontier, found = _bfs.bfs_c(
+                self._kernel_grid(), start[0], start[1], end[0], end[1])
+            tracker.nodes_explored = nodes
+            tracker.update_frontier_size(max_frontier)
+            return tracker.create_metrics(
+                algorithm_name="BFS (Queue)",
+                path=self._path_from_parent(parent, found),
+                time_complexity="O(V + E)",
+                space_complexity="O(V)",
+                is_optimal=True
+            )
+
+        if self._use_kernel():
+            parent, nodes, max_frontier, found = _kernels.bfs_kernel(
+                self._kernel_grid(), start[0], start[1], end[0], end[1])
+            tracker.nodes_explored = nodes
+            tracker.update_frontier_size(max_frontier)
+            return tracker.create_metrics(
+                algorithm_name="BFS (Queue)",
+                path=self._path_from_parent(parent, found),
+                time_complexity="O(V + E)",
+                space_complexity="O(V)",
+                is_optimal=True
+            )
+
+        grid = self.maze.grid
+        rows, cols = self.maze.rows, self.maze.cols
+        wall = CellType.WALL.value
+        cb = self.visualization_callback
+
+        # Queue for BFS (FIFO): a plain list plus a head index. Cells are
+        # enqueued at most once, so the list never exceeds rows * cols and
+        # no wraparound or popleft bookkeeping is needed; visited is a
+        # flat dense byte map indexed by r * cols + c
+        queue = [start]
+        head = 0
+        visited = bytearray(rows * cols)
+        visited[start[0] * cols + start[1]] = 1
         came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        
+
         found = False
-        
-        while queue:
-            tracker.update_frontier_size(len(queue))
-            current = queue.popleft()
-            tracker.increment_nodes()
-            
-            self._visualize_step(current[0], current[1], 'exploring')
-            
+        nodes = 0
+        max_frontier = 0
+
+        while head < len(queue):
+            if len(queue) - head > max_frontier:
+                max_frontier = len(queue) - head
+            current = queue[head]
+            head += 1
+            nodes += 1
+
+            if cb:
+                cb(current[0], current[1], 'exploring')
+
             if current == end:
                 found = True
                 break
-            
-            # Explore neighbors
-            for neighbor in self.maze.get_neighbors(current[0], current[1]):
-                if neighbor not in visited:
-                    visited.add(neighbor)
+
+            # Explore neighbors (unrolled: up, down, left, right)
+            r, c = current
+            for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                nr, nc = neighbor
+                if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                    continue
+                nidx = nr * cols + nc
+                if not visited[nidx]:
+                    visited[nidx] = 1
                     queue.append(neighbor)
                     came_from[neighbor] = current
-                    self._visualize_step(neighbor[0], neighbor[1], 'visited')
+                    if cb:
+                        cb(neighbor[0], neighbor[1], 'visited')
         
-        # Reconstruct path
+        tracker.nodes_explored = nodes
+        tracker.update_frontier_size(max_frontier)
+
+        # Reconstruct path: collect cells and forward them to the
+        # visualizer in a single walk over the parent chain
         path = []
         if found:
-            path = self._reconstruct_path(came_from, end)
-            for row, col in path:
-                if (row, col) != start and (row, col) != end:
-                    self._visualize_step(row, col, 'path')
+            for cell in self._iter_path(came_from, end):
+                path.append(cell)
+                if cb and cell != start and cell != end:
+                    cb(cell[0], cell[1], 'path')
+            path.reverse()
         
         return tracker.create_metrics(
             algorithm_name="BFS (Queue)",
@@ -192,48 +337,150 @@ class PathfindingAlgorithms:
         
         start = self.maze.start
         end = self.maze.end
-        
-        # Priority queue: (cost, node)
-        pq = [(0, start)]
-        visited: Set[Tuple[int, int]] = set()
+        # Uniform-cost check up front: the base Maze returns 1.0 for
+        # every edge, and the compiled kernels bake that in, so a
+        # subclass overriding get_edge_weight must take the Python loop
+        unweighted = type(self.maze).get_edge_weight is Maze.get_edge_weight
+
+        # Fast path: compiled kernel when no step-by-step visualization
+        # and no custom edge weights (the Cython extension wins on
+        # first call since it needs no JIT)
+        if (unweighted and self.visualization_callback is None
+                and (_astar is not None or self._use_kernel())):
+            if _astar is not None:
+                parent, nodes, max_frontier, found = _astar.dijkstra_c(
+                    self._kernel_grid(), start[0], start[1], end[0], end[1])
+            else:
+                parent, nodes, max_frontier, found = _kernels.dijkstra_kernel(
+                    self._kernel_grid(), start[0], start[1], end[0], end[1])
+            tracker.nodes_explored = nodes
+            tracker.update_frontier_size(max_frontier)
+            return tracker.create_metrics(
+                algorithm_name="Dijkstra (Min-Heap)",
+                path=self._path_from_parent(parent, found),
+                time_complexity="O((V + E) log V)",
+                space_complexity="O(V)",
+                is_optimal=True
+            )
+
+        grid = self.maze.grid
+        rows, cols = self.maze.rows, self.maze.cols
+        wall = CellType.WALL.value
+        cb = self.visualization_callback
+        get_weight = self.maze.get_edge_weight
+
+        # Visited and cost_so_far are flat dense arrays indexed by
+        # r * cols + c (an inf-initialized cost slot doubles as the
+        # "not yet reached" check)
+        visited = bytearray(rows * cols)
         came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        cost_so_far: Dict[Tuple[int, int], float] = {start: 0}
-        
+        cost_so_far = [float('inf')] * (rows * cols)
+        cost_so_far[start[0] * cols + start[1]] = 0
+
         found = False
-        
+        nodes = 0
+        max_frontier = 0
+
+        if unweighted:
+            # Dial's bucket queue: with uniform unit weights every
+            # tentative distance is a small integer and pops come out
+            # in non-decreasing order, so per-distance buckets replace
+            # the heap. Push and pop become O(1) list appends/pops
+            # instead of O(log n) sifts, and only buckets d and d + 1
+            # are ever non-empty
+            buckets: List[List[Tuple[int, int]]] = [[start], []]
+            in_queue = 1
+            d = 0
+            while in_queue:
+                if in_queue > max_frontier:
+                    max_frontier = in_queue
+                while not buckets[d]:
+                    d += 1
+                current = buckets[d].pop()
+                in_queue -= 1
+                cidx = current[0] * cols + current[1]
+
+                if visited[cidx]:
+                    continue
+
+                visited[cidx] = 1
+                nodes += 1
+
+                if cb:
+                    cb(current[0], current[1], 'exploring')
+
+                if current == end:
+                    found = True
+                    break
+
+                # Explore neighbors (unrolled: up, down, left, right)
+                r, c = current
+                nd = d + 1
+                if nd >= len(buckets):
+                    buckets.append([])
+                for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                    nr, nc = neighbor
+                    if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                        continue
+                    nidx = nr * cols + nc
+                    if nd < cost_so_far[nidx]:
+                        cost_so_far[nidx] = nd
+                        buckets[nd].append(neighbor)
+                        in_queue += 1
+                        came_from[neighbor] = current
+                        if cb:
+                            cb(neighbor[0], neighbor[1], 'visited')
+
+        # Overridden edge weights can be arbitrary floats, so the
+        # general case keeps the (cost, node) binary heap
+        pq = [] if unweighted else [(0, start)]
         while pq:
-            tracker.update_frontier_size(len(pq))
+            if len(pq) > max_frontier:
+                max_frontier = len(pq)
             current_cost, current = heapq.heappop(pq)
-            
-            if current in visited:
+            cidx = current[0] * cols + current[1]
+
+            if visited[cidx]:
                 continue
-            
-            visited.add(current)
-            tracker.increment_nodes()
-            
-            self._visualize_step(current[0], current[1], 'exploring')
-            
+
+            visited[cidx] = 1
+            nodes += 1
+
+            if cb:
+                cb(current[0], current[1], 'exploring')
+
             if current == end:
                 found = True
                 break
-            
-            # Explore neighbors
-            for neighbor in self.maze.get_neighbors(current[0], current[1]):
-                new_cost = current_cost + self.maze.get_edge_weight(current, neighbor)
-                
-                if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                    cost_so_far[neighbor] = new_cost
+
+            # Explore neighbors (unrolled: up, down, left, right)
+            r, c = current
+            for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                nr, nc = neighbor
+                if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                    continue
+                new_cost = current_cost + get_weight(current, neighbor)
+                nidx = nr * cols + nc
+
+                if new_cost < cost_so_far[nidx]:
+                    cost_so_far[nidx] = new_cost
                     heapq.heappush(pq, (new_cost, neighbor))
                     came_from[neighbor] = current
-                    self._visualize_step(neighbor[0], neighbor[1], 'visited')
-        
-        # Reconstruct path
+                    if cb:
+                        cb(neighbor[0], neighbor[1], 'visited')
+
+        tracker.nodes_explored = nodes
+        tracker.update_frontier_size(max_frontier)
+
+        # Reconstruct path: collect cells and forward them to the
+        # visualizer in a single walk over the parent chain
         path = []
         if found:
-            path = self._reconstruct_path(came_from, end)
-            for row, col in path:
-                if (row, col) != start and (row, col) != end:
-                    self._visualize_step(row, col, 'path')
+            for cell in self._iter_path(came_from, end):
+                path.append(cell)
+                if cb and cell != start and cell != end:
+                    cb(cell[0], cell[1], 'path')
+            path.reverse()
         
         return tracker.create_metrics(
             algorithm_name="Dijkstra (Min-Heap)",
@@ -243,6 +490,65 @@ class PathfindingAlgorithms:
             is_optimal=True  # Dijkstra guarantees optimal path
         )
     
+    def dijkstra_multi(self, sources: List[Tuple[int, int]]) -> Tuple[List[float], List[int]]:
+        """
+        Multi-source Dijkstra: one sweep from many seeds
+
+        Seeds the priority queue with every source at cost 0, so a single
+        run replaces len(sources) separate solves when only distances or
+        nearest-source assignments are needed (e.g. walkshed-style
+        analyses). Runs without visualization or metrics tracking.
+
+        Args:
+            sources: Seed cells, each expanded at cost 0
+
+        Returns:
+            (cost, parent) flat lists indexed by row * cols + col:
+            cost[i] is the distance from the nearest source (inf if
+            unreachable) and parent[i] is the predecessor index on that
+            cheapest path (-1 for sources and unreached cells)
+        """
+        grid = self.maze.grid
+        rows, cols = self.maze.rows, self.maze.cols
+        wall = CellType.WALL.value
+        n = rows * cols
+        get_weight = self.maze.get_edge_weight
+        unweighted = type(self.maze).get_edge_weight is Maze.get_edge_weight
+
+        visited = bytearray(n)
+        cost = [float('inf')] * n
+        parent = [-1] * n
+
+        pq = []
+        for s in sources:
+            if self.maze.is_valid_cell(s[0], s[1]):
+                cost[s[0] * cols + s[1]] = 0
+                heapq.heappush(pq, (0, s))
+
+        while pq:
+            current_cost, current = heapq.heappop(pq)
+            cidx = current[0] * cols + current[1]
+
+            if visited[cidx]:
+                continue
+            visited[cidx] = 1
+
+            r, c = current
+            for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                nr, nc = neighbor
+                if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                    continue
+                new_cost = current_cost + (
+                    1.0 if unweighted else get_weight(current, neighbor))
+                nidx = nr * cols + nc
+
+                if new_cost < cost[nidx]:
+                    cost[nidx] = new_cost
+                    parent[nidx] = cidx
+                    heapq.heappush(pq, (new_cost, neighbor))
+
+        return cost, parent
+
     # ===== Heuristic Functions =====
     @staticmethod
     def manhattan_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> float:
@@ -267,6 +573,28 @@ class PathfindingAlgorithms:
         Good for 8-directional movement
         """
         return max(abs(pos1[0] - pos2[0]), abs(pos1[1] - pos2[1]))
+
+    def _h_table(self, heuristic: str) -> List[float]:
+        """
+        Precomputed heuristic table for the search hot loops
+
+        h(v) depends only on the fixed goal, so one vectorized pass
+        fills every cell up front and each lookup in the loop is a
+        single indexed load — no repeated arithmetic (or sqrt, for
+        euclidean) per relaxation of the same vertex. Flat-indexed by
+        r * cols + c; unknown names fall back to Manhattan, matching
+        the public dispatch.
+        """
+        er, ec = self.maze.end
+        dr = np.abs(np.arange(self.maze.rows, dtype=np.float64) - er).reshape(-1, 1)
+        dc = np.abs(np.arange(self.maze.cols, dtype=np.float64) - ec)
+        if heuristic == 'euclidean':
+            h_table = np.sqrt(dr * dr + dc * dc).ravel()
+        elif heuristic == 'chebyshev':
+            h_table = np.maximum(dr, dc).ravel()
+        else:
+            h_table = (dr + dc).ravel()
+        return h_table.tolist()
     
     # ===== A* Algorithm =====
     def astar(self, heuristic: str = 'manhattan') -> AlgorithmMetrics:
@@ -285,59 +613,138 @@ class PathfindingAlgorithms:
         tracker = MetricsTracker()
         tracker.start_tracking()
         
-        # Select heuristic function
-        heuristic_func = {
-            'manhattan': self.manhattan_distance,
-            'euclidean': self.euclidean_distance,
-            'chebyshev': self.chebyshev_distance
-        }.get(heuristic, self.manhattan_distance)
-        
         start = self.maze.start
         end = self.maze.end
-        
-        # Priority queue: (f_score, g_score, node)
-        pq = [(heuristic_func(start, end), 0, start)]
-        visited: Set[Tuple[int, int]] = set()
+        # Uniform-cost check up front: the base Maze returns 1.0 for
+        # every edge; both shortcuts below assume that, so a subclass
+        # overriding get_edge_weight must take the Python loop
+        unweighted = type(self.maze).get_edge_weight is Maze.get_edge_weight
+
+        # Trivial case: when the bounding rectangle between start and
+        # end holds no walls, an L-shaped walk is already an optimal
+        # path, so emit it analytically in O(|dr| + |dc|) instead of
+        # searching. Only taken without a callback — animated runs
+        # should still show the exploration
+        if unweighted and self.visualization_callback is None:
+            r0, c0 = start
+            er, ec = end
+            box = self.maze.grid[min(r0, er):max(r0, er) + 1,
+                                 min(c0, ec):max(c0, ec) + 1]
+            if not np.any(box == CellType.WALL.value):
+                step_r = 1 if er >= r0 else -1
+                step_c = 1 if ec >= c0 else -1
+                path = [(r, c0) for r in range(r0, er + step_r, step_r)]
+                path += [(er, c) for c in range(c0 + step_c, ec + step_c, step_c)]
+                # The construction touches exactly the path cells
+                tracker.nodes_explored = len(path)
+                tracker.update_frontier_size(1)
+                return tracker.create_metrics(
+                    algorithm_name=f"A* ({heuristic.capitalize()})",
+                    path=path,
+                    time_complexity="O(b^d)",
+                    space_complexity="O(V)",
+                    is_optimal=True,
+                    heuristic=heuristic.capitalize()
+                )
+
+        # Fast path: compiled kernel when no step-by-step visualization
+        # and no custom edge weights (the Cython extension wins on
+        # first call since it needs no JIT)
+        if (unweighted and self.visualization_callback is None
+                and (_astar is not None or self._use_kernel())):
+            h_code = {
+                'manhattan': _kernels.H_MANHATTAN,
+                'euclidean': _kernels.H_EUCLIDEAN,
+                'chebyshev': _kernels.H_CHEBYSHEV
+            }.get(heuristic, _kernels.H_MANHATTAN)
+            if _astar is not None:
+                parent, nodes, max_frontier, found = _astar.astar_c(
+                    self._kernel_grid(), start[0], start[1], end[0], end[1], h_code)
+            else:
+                parent, nodes, max_frontier, found = _kernels.astar_kernel(
+                    self._kernel_grid(), start[0], start[1], end[0], end[1], h_code)
+            tracker.nodes_explored = nodes
+            tracker.update_frontier_size(max_frontier)
+            return tracker.create_metrics(
+                algorithm_name=f"A* ({heuristic.capitalize()})",
+                path=self._path_from_parent(parent, found),
+                time_complexity="O(b^d)",
+                space_complexity="O(V)",
+                is_optimal=True,
+                heuristic=heuristic.capitalize()
+            )
+
+        grid = self.maze.grid
+        rows, cols = self.maze.rows, self.maze.cols
+        wall = CellType.WALL.value
+        cb = self.visualization_callback
+        get_weight = self.maze.get_edge_weight
+
+        h_table = self._h_table(heuristic)
+
+        # Priority queue: (f_score, g_score, node); visited and g_score
+        # are flat dense arrays indexed by r * cols + c
+        start_idx = start[0] * cols + start[1]
+        pq = [(h_table[start_idx], 0, start)]
+        visited = bytearray(rows * cols)
         came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        g_score: Dict[Tuple[int, int], float] = {start: 0}
-        
+        g_score = [float('inf')] * (rows * cols)
+        g_score[start_idx] = 0
+
+
         found = False
-        
+        nodes = 0
+        max_frontier = 0
+
         while pq:
-            tracker.update_frontier_size(len(pq))
+            if len(pq) > max_frontier:
+                max_frontier = len(pq)
             f, current_g, current = heapq.heappop(pq)
-            
-            if current in visited:
+            cidx = current[0] * cols + current[1]
+
+            if visited[cidx]:
                 continue
+
+            visited[cidx] = 1
+            nodes += 1
             
-            visited.add(current)
-            tracker.increment_nodes()
-            
-            self._visualize_step(current[0], current[1], 'exploring')
+            if cb:
+                cb(current[0], current[1], 'exploring')
             
             if current == end:
                 found = True
                 break
             
-            # Explore neighbors
-            for neighbor in self.maze.get_neighbors(current[0], current[1]):
-                new_g = current_g + self.maze.get_edge_weight(current, neighbor)
-                
-                if neighbor not in g_score or new_g < g_score[neighbor]:
-                    g_score[neighbor] = new_g
-                    h = heuristic_func(neighbor, end)
-                    f_score = new_g + h
+            # Explore neighbors (unrolled: up, down, left, right)
+            r, c = current
+            for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                nr, nc = neighbor
+                if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                    continue
+                new_g = current_g + (
+                    1.0 if unweighted else get_weight(current, neighbor))
+                nidx = nr * cols + nc
+
+                if new_g < g_score[nidx]:
+                    g_score[nidx] = new_g
+                    f_score = new_g + h_table[nidx]
                     heapq.heappush(pq, (f_score, new_g, neighbor))
                     came_from[neighbor] = current
-                    self._visualize_step(neighbor[0], neighbor[1], 'visited')
+                    if cb:
+                        cb(neighbor[0], neighbor[1], 'visited')
         
-        # Reconstruct path
+        tracker.nodes_explored = nodes
+        tracker.update_frontier_size(max_frontier)
+
+        # Reconstruct path: collect cells and forward them to the
+        # visualizer in a single walk over the parent chain
         path = []
         if found:
-            path = self._reconstruct_path(came_from, end)
-            for row, col in path:
-                if (row, col) != start and (row, col) != end:
-                    self._visualize_step(row, col, 'path')
+            for cell in self._iter_path(came_from, end):
+                path.append(cell)
+                if cb and cell != start and cell != end:
+                    cb(cell[0], cell[1], 'path')
+            path.reverse()
         
         return tracker.create_metrics(
             algorithm_name=f"A* ({heuristic.capitalize()})",
@@ -366,55 +773,94 @@ class PathfindingAlgorithms:
         tracker = MetricsTracker()
         tracker.start_tracking()
         
-        # Select heuristic function
-        heuristic_func = {
-            'manhattan': self.manhattan_distance,
-            'euclidean': self.euclidean_distance,
-            'chebyshev': self.chebyshev_distance
-        }.get(heuristic, self.manhattan_distance)
-        
         start = self.maze.start
         end = self.maze.end
-        
-        # Priority queue: (h_score, node)
-        pq = [(heuristic_func(start, end), start)]
-        visited: Set[Tuple[int, int]] = set()
+
+        # Fast path: compiled kernel when no step-by-step visualization
+        if self._use_kernel():
+            h_code = {
+                'manhattan': _kernels.H_MANHATTAN,
+                'euclidean': _kernels.H_EUCLIDEAN,
+                'chebyshev': _kernels.H_CHEBYSHEV
+            }.get(heuristic, _kernels.H_MANHATTAN)
+            parent, nodes, max_frontier, found = _kernels.greedy_kernel(
+                self._kernel_grid(), start[0], start[1], end[0], end[1], h_code)
+            tracker.nodes_explored = nodes
+            tracker.update_frontier_size(max_frontier)
+            return tracker.create_metrics(
+                algorithm_name=f"Greedy Best-First ({heuristic.capitalize()})",
+                path=self._path_from_parent(parent, found),
+                time_complexity="O(b^m)",
+                space_complexity="O(V)",
+                is_optimal=False,
+                heuristic=heuristic.capitalize()
+            )
+
+        grid = self.maze.grid
+        rows, cols = self.maze.rows, self.maze.cols
+        wall = CellType.WALL.value
+        cb = self.visualization_callback
+
+        h_table = self._h_table(heuristic)
+
+        # Priority queue: (h_score, node); visited is a flat dense byte
+        # map indexed by r * cols + c
+        pq = [(h_table[start[0] * cols + start[1]], start)]
+        visited = bytearray(rows * cols)
         came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        
+
         found = False
-        
+        nodes = 0
+        max_frontier = 0
+
         while pq:
-            tracker.update_frontier_size(len(pq))
+            if len(pq) > max_frontier:
+                max_frontier = len(pq)
             h, current = heapq.heappop(pq)
-            
-            if current in visited:
+            cidx = current[0] * cols + current[1]
+
+            if visited[cidx]:
                 continue
+
+            visited[cidx] = 1
+            nodes += 1
             
-            visited.add(current)
-            tracker.increment_nodes()
-            
-            self._visualize_step(current[0], current[1], 'exploring')
+            if cb:
+                cb(current[0], current[1], 'exploring')
             
             if current == end:
                 found = True
                 break
             
-            # Explore neighbors
-            for neighbor in self.maze.get_neighbors(current[0], current[1]):
-                if neighbor not in visited:
-                    h_score = heuristic_func(neighbor, end)
-                    heapq.heappush(pq, (h_score, neighbor))
-                    if neighbor not in came_from:
-                        came_from[neighbor] = current
-                    self._visualize_step(neighbor[0], neighbor[1], 'visited')
+            # Explore neighbors (unrolled: up, down, left, right)
+            r, c = current
+            for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                nr, nc = neighbor
+                if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                    continue
+                nidx = nr * cols + nc
+                if not visited[nidx]:
+                    heapq.heappush(pq, (h_table[nidx], neighbor))
+                    # Unconditional: the latest predecessor is as good as
+                    # the first (greedy is non-optimal either way), and
+                    # parents always point at already-expanded nodes so
+                    # the chain stays acyclic
+                    came_from[neighbor] = current
+                    if cb:
+                        cb(neighbor[0], neighbor[1], 'visited')
         
-        # Reconstruct path
+        tracker.nodes_explored = nodes
+        tracker.update_frontier_size(max_frontier)
+
+        # Reconstruct path: collect cells and forward them to the
+        # visualizer in a single walk over the parent chain
         path = []
         if found:
-            path = self._reconstruct_path(came_from, end)
-            for row, col in path:
-                if (row, col) != start and (row, col) != end:
-                    self._visualize_step(row, col, 'path')
+            for cell in self._iter_path(came_from, end):
+                path.append(cell)
+                if cb and cell != start and cell != end:
+                    cb(cell[0], cell[1], 'path')
+            path.reverse()
         
         return tracker.create_metrics(
             algorithm_name=f"Greedy Best-First ({heuristic.capitalize()})",
@@ -425,92 +871,173 @@ class PathfindingAlgorithms:
             heuristic=heuristic.capitalize()
         )
     
+    # ===== Jump Point Search =====
+    def jps(self) -> AlgorithmMetrics:
+        """
+        Jump Point Search (4-connected uniform-cost variant)
+
+        Skips symmetric path segments by expanding only "jump points"
+        (the goal, forced turns, and corridor cells where a perpendicular
+        scan pays off), so far fewer nodes are expanded than A* while the
+        path stays optimal.
+
+        Time Complexity: O(b^d) worst case, typically far below A*
+        Space Complexity: O(V)
+
+        Returns:
+            AlgorithmMetrics object with performance data
+        """
+        tracker = MetricsTracker()
+        tracker.start_tracking()
+
+        start = self.maze.start
+        end = self.maze.end
+
+        parent, nodes, max_frontier, found = _kernels.jps_kernel(
+            self._kernel_grid(), start[0], start[1], end[0], end[1])
+        tracker.nodes_explored = nodes
+        tracker.update_frontier_size(max_frontier)
+
+        # The kernel links jump points only; interpolate the straight
+        # segments between them to get the full cell path
+        path = []
+        if found:
+            jump_points = self._path_from_parent(parent, found)
+            path = [jump_points[0]]
+            for (r0, c0), (r1, c1) in zip(jump_points, jump_points[1:]):
+                dr = (r1 > r0) - (r1 < r0)
+                dc = (c1 > c0) - (c1 < c0)
+                r, c = r0, c0
+                while (r, c) != (r1, c1):
+                    r += dr
+                    c += dc
+                    path.append((r, c))
+
+        return tracker.create_metrics(
+            algorithm_name="JPS",
+            path=path,
+            time_complexity="O(b^d)",
+            space_complexity="O(V)",
+            is_optimal=True
+        )
+
     # ===== Bidirectional Search (Bonus) =====
     def bidirectional_search(self) -> AlgorithmMetrics:
         """
         Bidirectional BFS - searches from both start and end simultaneously
-        
+
+        Expands one full BFS layer per side, then tests whether the two
+        frontiers intersect with a packed uint64 bitmask (one bitwise AND
+        covers 64 cells) instead of a per-pop membership check.
+
         Time Complexity: O(b^(d/2))
         Space Complexity: O(b^(d/2))
-        
+
         Returns:
             AlgorithmMetrics object with performance data
         """
         tracker = MetricsTracker()
         tracker.start_tracking()
-        
+
         start = self.maze.start
         end = self.maze.end
-        
-        # Two queues for forward and backward search
-        forward_queue = deque([start])
-        backward_queue = deque([end])
-        
+        grid = self.maze.grid
+        rows, cols = self.maze.rows, self.maze.cols
+        wall = CellType.WALL.value
+        cb = self.visualization_callback
+
+        # Visited sets as uint64 bitmasks over the flattened grid
+        words = (self.maze.rows * cols + 63) // 64
+        forward_bits = np.zeros(words, dtype=np.uint64)
+        backward_bits = np.zeros(words, dtype=np.uint64)
+
+        def set_bit(bits, cell):
+            idx = cell[0] * cols + cell[1]
+            bits[idx >> 6] |= np.uint64(1 << (idx & 63))
+
+        # Layer frontiers for forward and backward search
+        forward_frontier: List[Tuple[int, int]] = [start]
+        backward_frontier: List[Tuple[int, int]] = [end]
+
         forward_visited: Dict[Tuple[int, int], Tuple[int, int]] = {start: None}
         backward_visited: Dict[Tuple[int, int], Tuple[int, int]] = {end: None}
+        set_bit(forward_bits, start)
+        set_bit(backward_bits, end)
+
+        nodes = 0
+        max_frontier = 0
+
+        def find_meeting():
+            """Decode the lowest set bit of the frontier intersection"""
+            hit = forward_bits & backward_bits
+            nonzero = np.flatnonzero(hit)
+            if len(nonzero) == 0:
+                return None
+            word = int(nonzero[0])
+            bit = (int(hit[word]) & -int(hit[word])).bit_length() - 1
+            idx = word * 64 + bit
+            return (idx // cols, idx % cols)
+
+        def expand_layer(frontier, visited, bits):
+            """Expand one full BFS layer; returns the next frontier"""
+            next_frontier = []
+            nonlocal nodes
+            for current in frontier:
+                nodes += 1
+                if cb:
+                    cb(current[0], current[1], 'exploring')
+                r, c = current
+                for neighbor in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                    nr, nc = neighbor
+                    if not (0 <= nr < rows and 0 <= nc < cols and grid[nr, nc] != wall):
+                        continue
+                    if neighbor not in visited:
+                        visited[neighbor] = current
+                        set_bit(bits, neighbor)
+                        next_frontier.append(neighbor)
+                        if cb:
+                            cb(neighbor[0], neighbor[1], 'visited')
+            return next_frontier
+
+        meeting_point = find_meeting()  # start == end edge case
+
+        while forward_frontier and backward_frontier and meeting_point is None:
+            total = len(forward_frontier) + len(backward_frontier)
+            if total > max_frontier:
+                max_frontier = total
+
+            # Always expand the smaller frontier: when one side hits a
+            # dead-end region its layers stay tiny, and total work tracks
+            # the cheaper of the two searches
+            if len(forward_frontier) <= len(backward_frontier):
+                forward_frontier = expand_layer(
+                    forward_frontier, forward_visited, forward_bits)
+            else:
+                backward_frontier = expand_layer(
+                    backward_frontier, backward_visited, backward_bits)
+            meeting_point = find_meeting()
         
-        meeting_point = None
-        
-        while forward_queue and backward_queue:
-            tracker.update_frontier_size(len(forward_queue) + len(backward_queue))
-            
-            # Forward search
-            if forward_queue:
-                current = forward_queue.popleft()
-                tracker.increment_nodes()
-                self._visualize_step(current[0], current[1], 'exploring')
-                
-                # Check if paths meet
-                if current in backward_visited:
-                    meeting_point = current
-                    break
-                
-                for neighbor in self.maze.get_neighbors(current[0], current[1]):
-                    if neighbor not in forward_visited:
-                        forward_visited[neighbor] = current
-                        forward_queue.append(neighbor)
-                        self._visualize_step(neighbor[0], neighbor[1], 'visited')
-            
-            # Backward search
-            if backward_queue:
-                current = backward_queue.popleft()
-                tracker.increment_nodes()
-                self._visualize_step(current[0], current[1], 'exploring')
-                
-                # Check if paths meet
-                if current in forward_visited:
-                    meeting_point = current
-                    break
-                
-                for neighbor in self.maze.get_neighbors(current[0], current[1]):
-                    if neighbor not in backward_visited:
-                        backward_visited[neighbor] = current
-                        backward_queue.append(neighbor)
-                        self._visualize_step(neighbor[0], neighbor[1], 'visited')
-        
-        # Reconstruct path
+        tracker.nodes_explored = nodes
+        tracker.update_frontier_size(max_frontier)
+
+        # Reconstruct path: walk each parent chain once, emitting the
+        # visualization marks as the cells are collected
         path = []
         if meeting_point:
-            # Build forward path
-            forward_path = []
             current = meeting_point
             while current is not None:
-                forward_path.append(current)
+                path.append(current)
+                if cb and current != start and current != end:
+                    cb(current[0], current[1], 'path')
                 current = forward_visited[current]
-            forward_path.reverse()
-            
-            # Build backward path
-            backward_path = []
+            path.reverse()
+
             current = backward_visited[meeting_point]
             while current is not None:
-                backward_path.append(current)
+                path.append(current)
+                if cb and current != start and current != end:
+                    cb(current[0], current[1], 'path')
                 current = backward_visited[current]
-            
-            path = forward_path + backward_path
-            
-            for row, col in path:
-                if (row, col) != start and (row, col) != end:
-                    self._visualize_step(row, col, 'path')
         
         return tracker.create_metrics(
             algorithm_name="Bidirectional BFS",
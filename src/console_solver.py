@@ -2,11 +2,14 @@
 Console-based Maze Solver
 For testing and basic visualization without GUI
 """
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 from src.maze import Maze
 from src.algorithms import PathfindingAlgorithms
 from src.metrics import PerformanceComparator
 from src.dashboard import AnalyticsDashboard
-import time
+from src.advanced_features import _init_worker, _run_one
 
 
 def print_maze_with_path(maze: Maze):
@@ -39,53 +42,40 @@ def run_console_solver():
     # Initialize dashboard
     dashboard = AnalyticsDashboard()
     
-    # Test all algorithms
+    # Test all algorithms: (display name, dispatch key for _run_one)
     algorithms_to_test = [
-        ('DFS', lambda p: p.dfs()),
-        ('BFS', lambda p: p.bfs()),
-        ('Dijkstra', lambda p: p.dijkstra()),
-        ('A* (Manhattan)', lambda p: p.astar('manhattan')),
-        ('A* (Euclidean)', lambda p: p.astar('euclidean')),
-        ('Greedy Best-First', lambda p: p.greedy_best_first('manhattan')),
-        ('Bidirectional BFS', lambda p: p.bidirectional_search()),
+        ('DFS', 'dfs'),
+        ('BFS', 'bfs'),
+        ('Dijkstra', 'dijkstra'),
+        ('A* (Manhattan)', 'astar:manhattan'),
+        ('A* (Euclidean)', 'astar:euclidean'),
+        ('Greedy Best-First', 'greedy_best_first:manhattan'),
+        ('Bidirectional BFS', 'bidirectional_search'),
     ]
-    
+
     print("\n" + "=" * 80)
     print("RUNNING ALL ALGORITHMS...")
     print("=" * 80)
-    
-    for algo_name, algo_func in algorithms_to_test:
-        print(f"\n{'─' * 80}")
-        print(f"Testing: {algo_name}")
-        print(f"{'─' * 80}")
-        
-        # Reset maze visualization
-        maze.reset_path_visualization()
-        
-        # Create pathfinder
-        pathfinder = PathfindingAlgorithms(maze)
-        
-        # Run algorithm
-        metrics = algo_func(pathfinder)
-        
-        # Add to dashboard
-        dashboard.add_metrics(metrics)
-        
-        # Print results
-        print(metrics)
-        
-        # Show maze with path (optional, can be commented out for cleaner output)
-        if metrics.path_found and len(metrics.path) > 0:
-            # Mark path on maze
-            for row, col in metrics.path:
-                if (row, col) != maze.start and (row, col) != maze.end:
-                    from src.maze import CellType
-                    maze.grid[row][col] = CellType.PATH.value
-            
-            # print("Solution Path:")
-            # print_maze_with_path(maze)
-        
-        time.sleep(0.1)  # Small delay between algorithms
+
+    # The runs are independent solves of the same immutable maze, so
+    # fan them out one per process (the maze is pickled once per worker
+    # via the pool initializer) and report results as they arrive
+    with ProcessPoolExecutor(
+        max_workers=min(len(algorithms_to_test), os.cpu_count() or 1),
+        initializer=_init_worker,
+        initargs=(maze,)
+    ) as executor:
+        futures = [
+            executor.submit(_run_one, name, algo_key)
+            for name, algo_key in algorithms_to_test
+        ]
+        for future in as_completed(futures):
+            name, metrics = future.result()
+            print(f"\n{'─' * 80}")
+            print(f"Tested: {name}")
+            print(f"{'─' * 80}")
+            print(metrics)
+            dashboard.add_metrics(metrics)
     
     # Generate comparison reports
     print("\n" + "=" * 80)
@@ -10,6 +10,13 @@ from typing import List
 from src.metrics import AlgorithmMetrics, PerformanceComparator
 import json
 
+try:
+    # Optional Rust JSON encoder: several times faster than json on
+    # large metric bundles, with the stdlib module as the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class AnalyticsDashboard:
     """
@@ -19,32 +26,62 @@ class AnalyticsDashboard:
     def __init__(self):
         """Initialize dashboard"""
         self.comparator = PerformanceComparator()
+        # Reusable figures: subplot construction dominates Agg render
+        # time, so successive chart calls clear and redraw instead of
+        # allocating fresh Figure/Axes objects
+        self._fig_cmp = None
+        self._axes_cmp = None
+        self._fig_radar = None
+        self._ax_radar = None
     
     def add_metrics(self, metrics: AlgorithmMetrics):
         """Add algorithm metrics"""
         self.comparator.add_metrics(metrics)
     
-    def generate_comparison_charts(self, save_path: str = "results/comparison_charts.png"):
+    def generate_comparison_charts(self, save_path: str = "results/comparison_charts.png",
+                                   dpi: int = 150, tight: bool = False):
         """
         Generate comprehensive comparison charts
         
         Args:
             save_path: Path to save the chart image
+            dpi: Render resolution; 150 halves the pixel count of the
+                old 300 with no visible loss at dashboard size
+            tight: Recompute a tight bounding box when saving (extra
+                layout pass; the figures are pre-sized so it is off by
+                default)
         """
         if not self.comparator.all_metrics:
             print("No metrics to display")
             return
         
-        # Create figure with subplots
-        fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+        # Create (or clear and reuse) the figure with subplots
+        if self._fig_cmp is None:
+            self._fig_cmp, self._axes_cmp = plt.subplots(2, 3, figsize=(18, 10))
+        else:
+            for ax in self._axes_cmp.flat:
+                ax.clear()
+        fig, axes = self._fig_cmp, self._axes_cmp
         fig.suptitle('Pathfinding Algorithms Comparison', fontsize=16, fontweight='bold')
         
         metrics = self.comparator.all_metrics
         algorithms = [m.algorithm_name for m in metrics]
-        
+
+        # One pass over the metric objects into a typed record array;
+        # every chart below reads a contiguous field view instead of
+        # re-walking the Python objects per subplot
+        arr = np.fromiter(
+            (m.as_tuple() for m in metrics),
+            dtype=np.dtype([('nodes', 'i8'), ('time', 'f8'), ('memory', 'f8'),
+                            ('path', 'i8'), ('found', '?'), ('optimal', '?')]),
+            count=len(metrics))
+        nodes = arr['nodes']
+        times = arr['time']
+        memory = arr['memory']
+        path_lengths = np.where(arr['found'], arr['path'], 0)
+
         # 1. Nodes Explored
         ax1 = axes[0, 0]
-        nodes = [m.nodes_explored for m in metrics]
         colors = plt.cm.viridis(np.linspace(0, 1, len(algorithms)))
         bars1 = ax1.bar(range(len(algorithms)), nodes, color=colors)
         ax1.set_xlabel('Algorithm')
@@ -54,16 +91,12 @@ class AnalyticsDashboard:
         ax1.set_xticklabels(algorithms, rotation=45, ha='right', fontsize=8)
         ax1.grid(axis='y', alpha=0.3)
         
-        # Add value labels on bars
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{int(height)}',
-                    ha='center', va='bottom', fontsize=8)
+        # Value labels: one batched bar_label call per axes instead of a
+        # Python loop creating a text artist per bar
+        ax1.bar_label(bars1, fmt='%d', fontsize=8)
         
         # 2. Execution Time
         ax2 = axes[0, 1]
-        times = [m.execution_time for m in metrics]
         bars2 = ax2.bar(range(len(algorithms)), times, color=colors)
         ax2.set_xlabel('Algorithm')
         ax2.set_ylabel('Time (ms)')
@@ -72,15 +105,10 @@ class AnalyticsDashboard:
         ax2.set_xticklabels(algorithms, rotation=45, ha='right', fontsize=8)
         ax2.grid(axis='y', alpha=0.3)
         
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}',
-                    ha='center', va='bottom', fontsize=8)
+        ax2.bar_label(bars2, fmt='%.2f', fontsize=8)
         
         # 3. Memory Usage
         ax3 = axes[0, 2]
-        memory = [m.memory_used for m in metrics]
         bars3 = ax3.bar(range(len(algorithms)), memory, color=colors)
         ax3.set_xlabel('Algorithm')
         ax3.set_ylabel('Memory (KB)')
@@ -89,15 +117,10 @@ class AnalyticsDashboard:
         ax3.set_xticklabels(algorithms, rotation=45, ha='right', fontsize=8)
         ax3.grid(axis='y', alpha=0.3)
         
-        for bar in bars3:
-            height = bar.get_height()
-            ax3.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.2f}',
-                    ha='center', va='bottom', fontsize=8)
+        ax3.bar_label(bars3, fmt='%.2f', fontsize=8)
         
         # 4. Path Length
         ax4 = axes[1, 0]
-        path_lengths = [m.path_length if m.path_found else 0 for m in metrics]
         bars4 = ax4.bar(range(len(algorithms)), path_lengths, color=colors)
         ax4.set_xlabel('Algorithm')
         ax4.set_ylabel('Path Length')
@@ -106,28 +129,21 @@ class AnalyticsDashboard:
         ax4.set_xticklabels(algorithms, rotation=45, ha='right', fontsize=8)
         ax4.grid(axis='y', alpha=0.3)
         
-        for bar in bars4:
-            height = bar.get_height()
-            if height > 0:
-                ax4.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{int(height)}',
-                        ha='center', va='bottom', fontsize=8)
+        # Blank labels keep the skip-zero behavior for unsolved runs
+        ax4.bar_label(bars4, labels=[f'{int(h)}' if h > 0 else '' for h in path_lengths],
+                      fontsize=8)
         
         # 5. Efficiency Score (composite metric)
         ax5 = axes[1, 1]
-        # Normalize metrics and calculate efficiency score
-        max_nodes = max(nodes) if max(nodes) > 0 else 1
-        max_time = max(times) if max(times) > 0 else 1
-        
-        efficiency_scores = []
-        for m in metrics:
-            if m.path_found:
-                # Lower is better: combine normalized time and nodes
-                score = (1 - m.nodes_explored / max_nodes) * 0.5 + (1 - m.execution_time / max_time) * 0.5
-                efficiency_scores.append(score * 100)
-            else:
-                efficiency_scores.append(0)
-        
+        # Normalize and combine in one vectorized expression
+        # (lower nodes/time is better); unsolved runs score 0
+        max_nodes = nodes.max() or 1
+        max_time = times.max() or 1
+        efficiency_scores = np.where(
+            arr['found'],
+            ((1 - nodes / max_nodes) * 0.5 + (1 - times / max_time) * 0.5) * 100,
+            0.0)
+
         bars5 = ax5.bar(range(len(algorithms)), efficiency_scores, color=colors)
         ax5.set_xlabel('Algorithm')
         ax5.set_ylabel('Efficiency Score (%)')
@@ -137,17 +153,13 @@ class AnalyticsDashboard:
         ax5.grid(axis='y', alpha=0.3)
         ax5.set_ylim(0, 100)
         
-        for bar in bars5:
-            height = bar.get_height()
-            ax5.text(bar.get_x() + bar.get_width()/2., height,
-                    f'{height:.1f}',
-                    ha='center', va='bottom', fontsize=8)
+        ax5.bar_label(bars5, fmt='%.1f', fontsize=8)
         
         # 6. Optimality & Success Rate
         ax6 = axes[1, 2]
-        optimal_count = sum(1 for m in metrics if m.is_optimal and m.path_found)
-        suboptimal_count = sum(1 for m in metrics if not m.is_optimal and m.path_found)
-        failed_count = sum(1 for m in metrics if not m.path_found)
+        optimal_count = int((arr['optimal'] & arr['found']).sum())
+        suboptimal_count = int((~arr['optimal'] & arr['found']).sum())
+        failed_count = int((~arr['found']).sum())
         
         pie_data = [optimal_count, suboptimal_count, failed_count]
         pie_labels = [f'Optimal\n({optimal_count})', 
@@ -168,12 +180,12 @@ class AnalyticsDashboard:
             ax6.text(0.5, 0.5, 'No Data', ha='center', va='center')
             ax6.set_title('Solution Quality Distribution')
         
-        plt.tight_layout()
+        fig.tight_layout()
         
         # Save figure
         import os
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight' if tight else None)
         print(f"Charts saved to: {save_path}")
         
         # Don't show in headless mode
@@ -191,15 +203,18 @@ class AnalyticsDashboard:
         print("BEST PERFORMING ALGORITHMS")
         print("=" * 100)
         
-        best_time = self.comparator.get_best_algorithm('execution_time')
+        # All three extrema from a single pass over the metrics
+        bests = self.comparator.get_bests()
+
+        best_time = bests['execution_time']
         if best_time:
             print(f"⚡ Fastest: {best_time.algorithm_name} ({best_time.execution_time:.3f} ms)")
-        
-        best_nodes = self.comparator.get_best_algorithm('nodes_explored')
+
+        best_nodes = bests['nodes_explored']
         if best_nodes:
             print(f"🎯 Most Efficient: {best_nodes.algorithm_name} ({best_nodes.nodes_explored} nodes)")
-        
-        best_memory = self.comparator.get_best_algorithm('memory_used')
+
+        best_memory = bests['memory_used']
         if best_memory:
             print(f"💾 Least Memory: {best_memory.algorithm_name} ({best_memory.memory_used:.2f} KB)")
         
@@ -228,8 +243,12 @@ class AnalyticsDashboard:
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(data, f, indent=2)
         
         print(f"Metrics exported to: {filepath}")
     
@@ -249,23 +268,36 @@ class AnalyticsDashboard:
             print("No metrics to export")
             return
         
-        # Get fieldnames from first metric
-        fieldnames = list(self.comparator.all_metrics[0].to_dict().keys())
-        
+        # Fixed column order matching AlgorithmMetrics.to_dict; plain
+        # csv.writer plus a tuple generator streams the rows without
+        # building a dict per metric
+        fieldnames = ('algorithm', 'nodes_explored', 'path_length',
+                      'execution_time_ms', 'memory_kb', 'is_optimal',
+                      'path_found', 'time_complexity', 'space_complexity',
+                      'max_frontier_size', 'heuristic')
+
         with open(filepath, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for m in self.comparator.all_metrics:
-                writer.writerow(m.to_dict())
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (m.algorithm_name, m.nodes_explored, m.path_length,
+                 round(m.execution_time, 3), round(m.memory_used, 2),
+                 m.is_optimal, m.path_found, m.time_complexity,
+                 m.space_complexity, m.max_frontier_size,
+                 m.heuristic_used if m.heuristic_used else 'N/A')
+                for m in self.comparator.all_metrics)
         
         print(f"Metrics exported to: {filepath}")
     
-    def generate_radar_chart(self, save_path: str = "results/radar_chart.png"):
+    def generate_radar_chart(self, save_path: str = "results/radar_chart.png",
+                             dpi: int = 150, tight: bool = False):
         """
         Generate radar chart comparing algorithms across multiple dimensions
         
         Args:
             save_path: Path to save the chart image
+            dpi: Render resolution (see generate_comparison_charts)
+            tight: Recompute a tight bounding box when saving
         """
         if not self.comparator.all_metrics:
             print("No metrics to display")
@@ -280,11 +312,17 @@ class AnalyticsDashboard:
             print("No valid solutions to compare")
             return
         
-        # Normalize metrics (0-1 scale, higher is better)
-        max_nodes = max(m.nodes_explored for m in valid_metrics)
-        max_time = max(m.execution_time for m in valid_metrics)
-        max_memory = max(m.memory_used for m in valid_metrics)
-        max_path = max(m.path_length for m in valid_metrics)
+        # Normalize metrics (0-1 scale, higher is better): one pass into
+        # a record array, like generate_comparison_charts
+        varr = np.fromiter(
+            (m.as_tuple() for m in valid_metrics),
+            dtype=np.dtype([('nodes', 'i8'), ('time', 'f8'), ('memory', 'f8'),
+                            ('path', 'i8'), ('found', '?'), ('optimal', '?')]),
+            count=len(valid_metrics))
+        max_nodes = int(varr['nodes'].max())
+        max_time = float(varr['time'].max())
+        max_memory = float(varr['memory'].max())
+        max_path = int(varr['path'].max())
         
         categories = ['Speed\n(Time)', 'Efficiency\n(Nodes)', 'Memory', 'Path Quality']
         num_vars = len(categories)
@@ -293,7 +331,12 @@ class AnalyticsDashboard:
         angles = np.linspace(0, 2 * np.pi, num_vars, endpoint=False).tolist()
         angles += angles[:1]
         
-        fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(projection='polar'))
+        if self._fig_radar is None:
+            self._fig_radar, self._ax_radar = plt.subplots(
+                figsize=(10, 10), subplot_kw=dict(projection='polar'))
+        else:
+            self._ax_radar.clear()
+        fig, ax = self._fig_radar, self._ax_radar
         
         colors = plt.cm.tab10(np.linspace(0, 1, len(valid_metrics)))
         
@@ -318,17 +361,26 @@ class AnalyticsDashboard:
         ax.grid(True)
         ax.set_title('Algorithm Performance Radar Chart', size=16, fontweight='bold', pad=20)
         
-        plt.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
-        plt.tight_layout()
+        ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1))
+        fig.tight_layout()
         
         import os
         os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight' if tight else None)
         print(f"Radar chart saved to: {save_path}")
         
         # Don't show in headless mode
         # plt.show()
     
+    def close(self):
+        """Release the cached matplotlib figures"""
+        if self._fig_cmp is not None:
+            plt.close(self._fig_cmp)
+            self._fig_cmp = self._axes_cmp = None
+        if self._fig_radar is not None:
+            plt.close(self._fig_radar)
+            self._fig_radar = self._ax_radar = None
+
     def clear(self):
         """Clear all metrics"""
         self.comparator.clear()
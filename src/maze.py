@@ -6,6 +6,10 @@ import random
 from typing import List, Tuple, Set, Dict
 from enum import Enum
 
+import numpy as np
+
+from src import _kernels
+
 
 class CellType(Enum):
     """Cell types in the maze"""
@@ -18,6 +22,21 @@ class CellType(Enum):
     EXPLORING = 6
 
 
+# Raw cell values as plain module ints: the grid traversals below
+# compare against these instead of paying an Enum attribute lookup plus
+# a .value descriptor call per cell
+_EMPTY, _WALL, _START, _END, _PATH, _VISITED, _EXPLORING = (
+    c.value for c in CellType)
+
+# Symbol lookup table for __str__, indexed directly by cell value;
+# unknown values render as '?'
+_SYMBOLS = np.full(256, ord('?'), dtype=np.uint8)
+for _cell, _char in ((_EMPTY, '.'), (_WALL, '#'), (_START, 'S'),
+                     (_END, 'E'), (_PATH, '*'), (_VISITED, 'v'),
+                     (_EXPLORING, 'o')):
+    _SYMBOLS[_cell] = ord(_char)
+
+
 class Maze:
     """
     Graph-based maze representation using 2D grid and adjacency list
@@ -33,25 +52,76 @@ class Maze:
         """
         self.rows = rows
         self.cols = cols
-        self.grid: List[List[int]] = [[CellType.EMPTY.value for _ in range(cols)] for _ in range(rows)]
+        # Contiguous int8 grid: ~1 byte per cell instead of a boxed Python
+        # int, and directly usable by the compiled search kernels
+        self.grid: np.ndarray = np.full((rows, cols), _EMPTY, dtype=np.int8)
         self.start: Tuple[int, int] = (0, 0)
         self.end: Tuple[int, int] = (rows - 1, cols - 1)
-        self.adjacency_list: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
-        self._build_adjacency_list()
-    
+        self._adjacency_cache: Dict[Tuple[int, int], List[Tuple[int, int]]] = None
+        self._csr_cache: Tuple[np.ndarray, np.ndarray, np.ndarray] = None
+
+    @property
+    def adjacency_list(self) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """
+        Adjacency list representation of the maze graph
+
+        Built lazily on first access: the solvers compute neighbors on
+        the fly from the grid, so most maze edits never pay the
+        O(rows * cols) dict build at all. Performance-sensitive callers
+        should prefer the csr property, which keys cells by flat
+        r * cols + c index over contiguous arrays; this dict exists for
+        the tuple-keyed public API.
+        """
+        if self._adjacency_cache is None:
+            self._build_adjacency_list()
+        return self._adjacency_cache
+
     def _build_adjacency_list(self):
         """Build adjacency list representation of the maze graph"""
-        self.adjacency_list.clear()
+        adjacency = {}
         for row in range(self.rows):
             for col in range(self.cols):
-                if self.grid[row][col] != CellType.WALL.value:
-                    neighbors = self.get_neighbors(row, col)
-                    self.adjacency_list[(row, col)] = neighbors
+                if self.grid[row][col] != _WALL:
+                    adjacency[(row, col)] = self.get_neighbors(row, col)
+        self._adjacency_cache = adjacency
+
+    @property
+    def csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        CSR adjacency of the maze graph, built lazily and cached
+
+        Neighbors of flat cell index i are
+        indices[indptr[i]:indptr[i + 1]] with matching edge weights, so
+        consumers can walk the graph allocation-free over three
+        contiguous arrays instead of a dict of tuple lists.
+
+        Returns:
+            (indptr: int32[N + 1], indices: int32[E], weights: float32[E])
+        """
+        if self._csr_cache is None:
+            self._build_csr()
+        return self._csr_cache
+
+    def _build_csr(self):
+        """Build the CSR adjacency arrays in one compiled pass over the grid"""
+        indptr, indices = _kernels.csr_kernel(
+            np.ascontiguousarray(self.grid, dtype=np.int8))
+        weights = np.ones(len(indices), dtype=np.float32)
+        self._csr_cache = (indptr, indices, weights)
+
+    def _invalidate_adjacency(self):
+        """Drop the cached adjacency structures after a grid edit"""
+        self._adjacency_cache = None
+        self._csr_cache = None
     
     def get_neighbors(self, row: int, col: int) -> List[Tuple[int, int]]:
         """
         Get valid neighbors for a cell (4-directional movement)
-        
+
+        Allocates a fresh list per call, so it serves the one-shot graph
+        builders (adjacency list, CSR); the search hot loops inline the
+        four offset probes instead of calling this per expansion.
+
         Args:
             row: Row index
             col: Column index
@@ -67,7 +137,7 @@ class Maze:
             new_row, new_col = row + dr, col + dc
             if (0 <= new_row < self.rows and 
                 0 <= new_col < self.cols and 
-                self.grid[new_row][new_col] != CellType.WALL.value):
+                self.grid[new_row][new_col] != _WALL):
                 neighbors.append((new_row, new_col))
         
         return neighbors
@@ -75,37 +145,75 @@ class Maze:
     def set_wall(self, row: int, col: int):
         """Set a cell as wall"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.grid[row][col] = CellType.WALL.value
-            self._build_adjacency_list()
+            self.grid[row][col] = _WALL
+            self._invalidate_adjacency()
+
+    def toggle_wall(self, row: int, col: int):
+        """
+        Toggle a cell between wall and empty, patching the cached
+        adjacency dict in place
+
+        One toggle only affects the cell and its four neighbors, so an
+        existing dict cache is edited in O(1) instead of dropped and
+        rebuilt — interactive editors toggle one cell per click. The
+        CSR arrays cannot be patched cheaply and are invalidated.
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return
+        making_wall = self.grid[row][col] != _WALL
+        self.grid[row][col] = _WALL if making_wall else _EMPTY
+        self._csr_cache = None
+
+        adjacency = self._adjacency_cache
+        if adjacency is None:
+            return
+        cell = (row, col)
+        if making_wall:
+            adjacency.pop(cell, None)
+            for neighbor in ((row - 1, col), (row + 1, col),
+                             (row, col - 1), (row, col + 1)):
+                edges = adjacency.get(neighbor)
+                if edges is not None and cell in edges:
+                    edges.remove(cell)
+        else:
+            adjacency[cell] = self.get_neighbors(row, col)
+            for neighbor in adjacency[cell]:
+                edges = adjacency.get(neighbor)
+                if edges is not None and cell not in edges:
+                    edges.append(cell)
     
     def set_start(self, row: int, col: int):
         """Set start position"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
             self.start = (row, col)
-            self.grid[row][col] = CellType.START.value
-    
+            # Placing on a wall carves it, which changes the graph
+            if self.grid[row][col] == _WALL:
+                self._invalidate_adjacency()
+            self.grid[row][col] = _START
+
     def set_end(self, row: int, col: int):
         """Set end position"""
         if 0 <= row < self.rows and 0 <= col < self.cols:
             self.end = (row, col)
-            self.grid[row][col] = CellType.END.value
+            if self.grid[row][col] == _WALL:
+                self._invalidate_adjacency()
+            self.grid[row][col] = _END
     
     def is_valid_cell(self, row: int, col: int) -> bool:
         """Check if a cell is valid and not a wall"""
         return (0 <= row < self.rows and 
                 0 <= col < self.cols and 
-                self.grid[row][col] != CellType.WALL.value)
+                self.grid[row][col] != _WALL)
     
     def reset_path_visualization(self):
         """Reset visualization cells (keep walls, start, end)"""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.grid[row][col] in [CellType.PATH.value, CellType.VISITED.value, CellType.EXPLORING.value]:
-                    self.grid[row][col] = CellType.EMPTY.value
-        
+        # Single vectorized mask-and-assign; anything above PATH is a
+        # visualization marker (PATH, VISITED, EXPLORING)
+        self.grid[self.grid >= _PATH] = _EMPTY
+
         # Restore start and end
-        self.grid[self.start[0]][self.start[1]] = CellType.START.value
-        self.grid[self.end[0]][self.end[1]] = CellType.END.value
+        self.grid[self.start[0]][self.start[1]] = _START
+        self.grid[self.end[0]][self.end[1]] = _END
     
     def generate_random_maze(self, wall_probability: float = 0.3):
         """
@@ -114,65 +222,67 @@ class Maze:
         Args:
             wall_probability: Probability of a cell being a wall (0.0 to 1.0)
         """
-        # Reset grid
-        self.grid = [[CellType.EMPTY.value for _ in range(self.cols)] for _ in range(self.rows)]
-        
-        # Add random walls
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if random.random() < wall_probability:
-                    self.grid[row][col] = CellType.WALL.value
-        
+        # One vectorized draw instead of a Python RNG call per cell; the
+        # boolean mask is exactly the WALL/EMPTY encoding (1/0). Seeding
+        # flows through the random module like the DFS carver, so
+        # random.seed() keeps generation reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
+        self.grid = (rng.random((self.rows, self.cols))
+                     < wall_probability).astype(np.int8)
+
         # Ensure start and end are not walls
-        self.grid[self.start[0]][self.start[1]] = CellType.START.value
-        self.grid[self.end[0]][self.end[1]] = CellType.END.value
+        self.grid[self.start] = _START
+        self.grid[self.end] = _END
         
-        # Rebuild adjacency list
-        self._build_adjacency_list()
+        # Invalidate cached adjacency list
+        self._invalidate_adjacency()
     
     def generate_maze_dfs(self):
         """
-        Generate a perfect maze using recursive DFS (maze generation algorithm)
+        Generate a perfect maze using DFS (maze generation algorithm)
         Creates a maze with exactly one path between any two points
+
+        The carving runs in an iterative compiled kernel starting from
+        (1, 1); the explicit stack avoids the recursion limit that the
+        old recursive carver hit on large mazes. Seeding still flows
+        through the random module, so random.seed() keeps generation
+        reproducible.
         """
         # Initialize all cells as walls
-        self.grid = [[CellType.WALL.value for _ in range(self.cols)] for _ in range(self.rows)]
-        
-        # Start from (1, 1)
-        start_row, start_col = 1, 1
-        
-        def carve_path(row: int, col: int):
-            """Recursively carve paths in the maze"""
-            self.grid[row][col] = CellType.EMPTY.value
-            
-            # Get all possible directions
-            directions = [(-2, 0), (2, 0), (0, -2), (0, 2)]
-            random.shuffle(directions)
-            
-            for dr, dc in directions:
-                new_row, new_col = row + dr, col + dc
-                
-                if (0 <= new_row < self.rows and 
-                    0 <= new_col < self.cols and 
-                    self.grid[new_row][new_col] == CellType.WALL.value):
-                    
-                    # Carve the wall between
-                    wall_row, wall_col = row + dr // 2, col + dc // 2
-                    self.grid[wall_row][wall_col] = CellType.EMPTY.value
-                    
-                    # Recursively carve from new position
-                    carve_path(new_row, new_col)
-        
+        self.grid = np.full((self.rows, self.cols), _WALL, dtype=np.int8)
+
         if self.rows > 2 and self.cols > 2:
-            carve_path(start_row, start_col)
-        
+            _kernels.carve_kernel(self.grid, random.getrandbits(32))
+
         # Set start and end
-        self.grid[self.start[0]][self.start[1]] = CellType.START.value
-        self.grid[self.end[0]][self.end[1]] = CellType.END.value
+        self.grid[self.start[0]][self.start[1]] = _START
+        self.grid[self.end[0]][self.end[1]] = _END
         
-        # Rebuild adjacency list
-        self._build_adjacency_list()
+        # Invalidate cached adjacency list
+        self._invalidate_adjacency()
     
+    def snapshot(self) -> 'Maze':
+        """
+        Create a lightweight read-only snapshot of this maze
+
+        Shares the grid and adjacency list with the original instead of
+        deep-copying them, so it is cheap to hand one snapshot to each
+        parallel solver. Solvers must treat the shared structures as
+        read-only (they track visited/path state locally).
+
+        Returns:
+            A new Maze sharing this maze's grid and adjacency list
+        """
+        snap = Maze.__new__(Maze)
+        snap.rows = self.rows
+        snap.cols = self.cols
+        snap.grid = self.grid
+        snap.start = self.start
+        snap.end = self.end
+        snap._adjacency_cache = self._adjacency_cache
+        snap._csr_cache = self._csr_cache
+        return snap
+
     def get_edge_weight(self, from_cell: Tuple[int, int], to_cell: Tuple[int, int]) -> float:
         """
         Get edge weight between two cells (default is 1.0 for uniform cost)
@@ -182,17 +292,11 @@ class Maze:
     
     def __str__(self) -> str:
         """String representation of the maze"""
-        symbols = {
-            CellType.EMPTY.value: '.',
-            CellType.WALL.value: '#',
-            CellType.START.value: 'S',
-            CellType.END.value: 'E',
-            CellType.PATH.value: '*',
-            CellType.VISITED.value: 'v',
-            CellType.EXPLORING.value: 'o'
-        }
-        
-        result = []
-        for row in self.grid:
-            result.append(' '.join(symbols.get(cell, '?') for cell in row))
-        return '\n'.join(result)
+        # Vectorized table lookup, then one buffer with the column
+        # spacing interleaved; the trailing space of each row becomes
+        # its newline, so a single decode yields the whole string
+        chars = _SYMBOLS[self.grid.view(np.uint8)]
+        out = np.full((self.rows, 2 * self.cols), ord(' '), dtype=np.uint8)
+        out[:, ::2] = chars
+        out[:, -1] = ord('\n')
+        return out.tobytes().decode('ascii')[:-1]
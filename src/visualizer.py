@@ -3,8 +3,11 @@ Pygame Visualization Module
 Real-time visualization of pathfinding algorithms
 """
 import pygame
+import queue
 import sys
-from typing import Optional, List, Tuple
+import threading
+from typing import Optional, List, Set, Tuple
+import numpy as np
 from src.maze import Maze, CellType
 from src.algorithms import PathfindingAlgorithms
 from src.metrics import AlgorithmMetrics
@@ -69,16 +72,76 @@ class MazeVisualizer:
         self.running = True
         self.algorithm_running = False
         self.current_metrics: Optional[AlgorithmMetrics] = None
-        self.visualization_speed = 50  # milliseconds per step
+        # (metrics object, rendered text surfaces) for _draw_metrics
+        self._metrics_cache = (None, [])
+        self.visualization_speed = 50  # milliseconds per flushed frame
         self.step_delay = 0
+        # Algorithm steps batched into each visible animation frame
+        self.steps_per_frame = 8
         
-        # Buttons
+        # Buttons, plus their edges as flat arrays so hit-testing is
+        # one vectorized compare instead of a per-rect Python loop
         self.buttons = self._create_buttons()
-        
+        edges = np.array([[b['rect'].x, b['rect'].y,
+                           b['rect'].right, b['rect'].bottom]
+                          for b in self.buttons], dtype=np.int32)
+        self._btn_x0, self._btn_y0, self._btn_x1, self._btn_y1 = edges.T
+
+        # Pre-rendered cell tiles, one per display state
+        self._cell_tiles = self._build_cell_tiles()
+
+        # Solver worker thread and its step queue: the worker only
+        # enqueues (row, col, state) tuples, the main loop consumes
+        # them and is the sole writer of the grid and the screen
+        self._step_queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+        # Vectorized full-frame path: an RGB palette indexed by cell
+        # value (unknown values render as empty, like the old else
+        # branch), a reusable grid-sized surface, and the cell borders
+        # drawn once onto an overlay
+        self._palette = np.tile(np.array(COLORS['empty'], dtype=np.uint8), (128, 1))
+        for cell_type, key in ((CellType.EMPTY, 'empty'), (CellType.WALL, 'wall'),
+                               (CellType.START, 'start'), (CellType.END, 'end'),
+                               (CellType.PATH, 'path'), (CellType.VISITED, 'visited'),
+                               (CellType.EXPLORING, 'exploring')):
+            self._palette[cell_type.value] = COLORS[key]
+        self._grid_surface = pygame.Surface((self.grid_width, self.grid_height)).convert()
+        self._grid_lines = self._build_grid_lines()
+        # Grid edits set this; clean frames re-blit the cached surface
+        self._grid_dirty = True
+
         # Edit mode
         self.edit_mode = 'wall'  # 'wall', 'start', 'end'
         self.mouse_pressed = False
-    
+        # Cells already flipped during the current drag stroke
+        self._drag_toggled: Set[Tuple[int, int]] = set()
+
+    def _build_cell_tiles(self) -> dict:
+        """
+        Pre-render one Surface per cell state with the border baked in
+
+        _draw_grid blits these instead of issuing two draw.rect calls
+        per cell per frame; the whole grid then goes out as a single
+        batched blits() call.
+        """
+        tile_colors = {
+            CellType.EMPTY.value: COLORS['empty'],
+            CellType.WALL.value: COLORS['wall'],
+            CellType.START.value: COLORS['start'],
+            CellType.END.value: COLORS['end'],
+            CellType.PATH.value: COLORS['path'],
+            CellType.VISITED.value: COLORS['visited'],
+            CellType.EXPLORING.value: COLORS['exploring'],
+        }
+        tiles = {}
+        for value, color in tile_colors.items():
+            tile = pygame.Surface((self.cell_size, self.cell_size)).convert()
+            tile.fill(color)
+            pygame.draw.rect(tile, COLORS['grid'], tile.get_rect(), 1)
+            tiles[value] = tile
+        return tiles
+
     def _create_buttons(self) -> List[dict]:
         """Create UI buttons"""
         button_x = self.grid_width + 20
@@ -99,37 +162,41 @@ class MazeVisualizer:
             {'name': 'Random Maze', 'rect': pygame.Rect(button_x, button_y + (button_height + spacing) * 9, button_width, button_height), 'action': 'random'},
             {'name': 'Clear Path', 'rect': pygame.Rect(button_x, button_y + (button_height + spacing) * 10, button_width, button_height), 'action': 'clear'},
         ]
-        
+
+        # Pre-render the static labels once: font.render is one of the
+        # most expensive per-frame pygame calls and these never change
+        for button in buttons:
+            button['label'] = self.button_font.render(button['name'], True, COLORS['text'])
+            button['label_rect'] = button['label'].get_rect(center=button['rect'].center)
+
         return buttons
     
-    def _draw_grid(self):
-        """Draw the maze grid"""
+    def _build_grid_lines(self) -> pygame.Surface:
+        """Draw every cell border once onto a transparent overlay"""
+        lines = pygame.Surface((self.grid_width, self.grid_height), pygame.SRCALPHA)
+        cs = self.cell_size
         for row in range(self.maze.rows):
             for col in range(self.maze.cols):
-                x = col * self.cell_size
-                y = row * self.cell_size + self.header_height
-                
-                cell_value = self.maze.grid[row][col]
-                
-                # Determine color
-                if (row, col) == self.maze.start:
-                    color = COLORS['start']
-                elif (row, col) == self.maze.end:
-                    color = COLORS['end']
-                elif cell_value == CellType.WALL.value:
-                    color = COLORS['wall']
-                elif cell_value == CellType.PATH.value:
-                    color = COLORS['path']
-                elif cell_value == CellType.VISITED.value:
-                    color = COLORS['visited']
-                elif cell_value == CellType.EXPLORING.value:
-                    color = COLORS['exploring']
-                else:
-                    color = COLORS['empty']
-                
-                # Draw cell
-                pygame.draw.rect(self.screen, color, (x, y, self.cell_size, self.cell_size))
-                pygame.draw.rect(self.screen, COLORS['grid'], (x, y, self.cell_size, self.cell_size), 1)
+                pygame.draw.rect(lines, COLORS['grid'],
+                                 (col * cs, row * cs, cs, cs), 1)
+        return lines
+
+    def _draw_grid(self):
+        """Blit the cached grid surface, re-rendering only when dirty"""
+        # The surface holds the last full render; idle frames at 60fps
+        # pay one blit. Edits mark it dirty, and the re-render is a
+        # single NumPy gather: cell codes -> RGB image, scaled up by
+        # pixel repetition, pushed into the surface, borders overlaid
+        if self._grid_dirty:
+            cs = self.cell_size
+            img = self._palette[np.abs(self.maze.grid)]
+            img[self.maze.start] = COLORS['start']
+            img[self.maze.end] = COLORS['end']
+            img = np.repeat(np.repeat(img, cs, axis=0), cs, axis=1)
+            pygame.surfarray.blit_array(self._grid_surface, img.swapaxes(0, 1))
+            self._grid_surface.blit(self._grid_lines, (0, 0))
+            self._grid_dirty = False
+        self.screen.blit(self._grid_surface, (0, self.header_height))
     
     def _draw_header(self):
         """Draw header with title"""
@@ -144,23 +211,27 @@ class MazeVisualizer:
         subtitle_rect = subtitle.get_rect(center=(self.width // 2, self.header_height // 2 + 20))
         self.screen.blit(subtitle, subtitle_rect)
     
+    def _button_at(self, pos: Tuple[int, int]) -> Optional[dict]:
+        """Hit-test all buttons in one vectorized point-in-rect compare"""
+        x, y = pos
+        mask = ((self._btn_x0 <= x) & (x < self._btn_x1) &
+                (self._btn_y0 <= y) & (y < self._btn_y1))
+        idx = int(np.argmax(mask))
+        return self.buttons[idx] if mask[idx] else None
+
     def _draw_buttons(self):
         """Draw UI buttons"""
-        mouse_pos = pygame.mouse.get_pos()
-        
+        hovered = self._button_at(pygame.mouse.get_pos())
+
         for button in self.buttons:
-            # Check hover
-            is_hover = button['rect'].collidepoint(mouse_pos)
-            color = COLORS['button_hover'] if is_hover else COLORS['button']
+            color = COLORS['button_hover'] if button is hovered else COLORS['button']
             
             # Draw button
             pygame.draw.rect(self.screen, color, button['rect'], border_radius=5)
             pygame.draw.rect(self.screen, COLORS['text'], button['rect'], 2, border_radius=5)
-            
-            # Draw text
-            text = self.button_font.render(button['name'], True, COLORS['text'])
-            text_rect = text.get_rect(center=button['rect'].center)
-            self.screen.blit(text, text_rect)
+
+            # Draw the pre-rendered label
+            self.screen.blit(button['label'], button['label_rect'])
     
     def _draw_metrics(self):
         """Draw performance metrics"""
@@ -169,59 +240,91 @@ class MazeVisualizer:
         
         metrics_x = self.grid_width + 20
         metrics_y = self.header_height + 520
-        
-        m = self.current_metrics
-        
-        metrics_text = [
-            f"Algorithm: {m.algorithm_name}",
-            f"Path Found: {'✓' if m.path_found else '✗'}",
-            f"Optimal: {'✓' if m.is_optimal else '✗'}",
-            f"Nodes Explored: {m.nodes_explored}",
-            f"Path Length: {m.path_length}",
-            f"Time: {m.execution_time:.2f} ms",
-            f"Memory: {m.memory_used:.2f} KB",
-            f"Complexity: {m.time_complexity}",
-        ]
-        
-        for i, text in enumerate(metrics_text):
-            surface = self.metrics_font.render(text, True, COLORS['text'])
+
+        # Re-render the text surfaces only when the metrics object
+        # changes; idle frames just re-blit the cached ones
+        if self.current_metrics is not self._metrics_cache[0]:
+            m = self.current_metrics
+            metrics_text = [
+                f"Algorithm: {m.algorithm_name}",
+                f"Path Found: {'✓' if m.path_found else '✗'}",
+                f"Optimal: {'✓' if m.is_optimal else '✗'}",
+                f"Nodes Explored: {m.nodes_explored}",
+                f"Path Length: {m.path_length}",
+                f"Time: {m.execution_time:.2f} ms",
+                f"Memory: {m.memory_used:.2f} KB",
+                f"Complexity: {m.time_complexity}",
+            ]
+            self._metrics_cache = (m, [
+                self.metrics_font.render(text, True, COLORS['text'])
+                for text in metrics_text])
+
+        for i, surface in enumerate(self._metrics_cache[1]):
             self.screen.blit(surface, (metrics_x, metrics_y + i * 25))
     
+    def _blit_cell(self, row: int, col: int):
+        """Patch the cached grid surface with one cell's tile"""
+        if (row, col) == self.maze.start:
+            value = CellType.START.value
+        elif (row, col) == self.maze.end:
+            value = CellType.END.value
+        else:
+            value = int(self.maze.grid[row][col])
+        tile = self._cell_tiles.get(value, self._cell_tiles[CellType.EMPTY.value])
+        self._grid_surface.blit(tile, (col * self.cell_size, row * self.cell_size))
+
     def _visualization_callback(self, row: int, col: int, state: str):
-        """Callback for algorithm visualization"""
-        if state == 'exploring':
-            self.maze.grid[row][col] = CellType.EXPLORING.value
-        elif state == 'visited':
-            if self.maze.grid[row][col] == CellType.EMPTY.value:
-                self.maze.grid[row][col] = CellType.VISITED.value
-        elif state == 'path':
-            self.maze.grid[row][col] = CellType.PATH.value
-        
-        # Update display
-        self._draw()
-        pygame.display.flip()
-        
-        # Small delay for visualization
-        pygame.time.delay(self.visualization_speed)
-        
-        # Process events to keep UI responsive
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
+        """Worker-side callback: hand the step to the UI thread
+
+        Runs on the solver thread, which must not touch pygame or the
+        grid; it only enqueues, and the main loop applies the steps.
+        """
+        self._step_queue.put((row, col, state))
+
+    def _drain_steps(self):
+        """Apply queued solver steps, steps_per_frame per frame
+
+        The main loop is the single writer: each consumed step mutates
+        the grid and patches the cached grid surface, so the solver
+        runs at full CPU speed while the animation advances a bounded
+        number of cells per 60fps frame.
+        """
+        for _ in range(self.steps_per_frame):
+            try:
+                row, col, state = self._step_queue.get_nowait()
+            except queue.Empty:
+                return
+            if state == 'done':
+                self._finish_algorithm(col)
+                return
+            if state == 'exploring':
+                self.maze.grid[row][col] = CellType.EXPLORING.value
+            elif state == 'visited':
+                if self.maze.grid[row][col] == CellType.EMPTY.value:
+                    self.maze.grid[row][col] = CellType.VISITED.value
+            elif state == 'path':
+                self.maze.grid[row][col] = CellType.PATH.value
+            self._blit_cell(row, col)
+
+    def _finish_algorithm(self, metrics: Optional[AlgorithmMetrics]):
+        """Consume the worker's completion step on the UI thread"""
+        # Non-animated runs queued no cell steps; mark the solution
+        # cells so the next frame shows it
+        if metrics and self.visualization_speed == 0:
+            for row, col in metrics.path:
+                if (row, col) != self.maze.start and (row, col) != self.maze.end:
+                    self.maze.grid[row][col] = CellType.PATH.value
+            self._grid_dirty = True
+
+        self.current_metrics = metrics
+        self.algorithm_running = False
+
+        # Print metrics to console
+        if metrics:
+            print(metrics)
     
-    def _run_algorithm(self, algorithm_name: str):
-        """Run selected algorithm"""
-        if self.algorithm_running:
-            return
-        
-        self.algorithm_running = True
-        self.maze.reset_path_visualization()
-        
-        # Create pathfinding instance
-        pathfinder = PathfindingAlgorithms(self.maze)
-        pathfinder.set_visualization_callback(self._visualization_callback)
-        
-        # Run algorithm
+    def _solve(self, pathfinder: PathfindingAlgorithms, algorithm_name: str):
+        """Worker-thread body: run the solver, then queue completion"""
         if algorithm_name == 'dfs':
             metrics = pathfinder.dfs()
         elif algorithm_name == 'bfs':
@@ -238,35 +341,56 @@ class MazeVisualizer:
             metrics = pathfinder.bidirectional_search()
         else:
             metrics = None
-        
-        self.current_metrics = metrics
-        self.algorithm_running = False
-        
-        # Print metrics to console
-        if metrics:
-            print(metrics)
+        # Completion rides the same queue, so every pending cell step
+        # is applied first ('done' cannot collide with a cell state)
+        self._step_queue.put((-1, metrics, 'done'))
+
+    def _run_algorithm(self, algorithm_name: str):
+        """Launch the selected algorithm on a worker thread
+
+        The solve streams its steps through the queue instead of
+        re-entering the draw code; the main loop stays at 60fps and
+        keeps handling input while _drain_steps animates progress.
+        """
+        if self.algorithm_running:
+            return
+
+        self.algorithm_running = True
+        self.maze.reset_path_visualization()
+        self._grid_dirty = True
+
+        # At full speed there is nothing to animate, so the callback
+        # stays unset and the solvers take their compiled fast paths
+        pathfinder = PathfindingAlgorithms(self.maze)
+        if self.visualization_speed > 0:
+            pathfinder.set_visualization_callback(self._visualization_callback)
+
+        self._worker = threading.Thread(
+            target=self._solve, args=(pathfinder, algorithm_name), daemon=True)
+        self._worker.start()
     
     def _handle_mouse_click(self, pos: Tuple[int, int]):
         """Handle mouse click events"""
         x, y = pos
         
         # Check button clicks
-        for button in self.buttons:
-            if button['rect'].collidepoint(pos):
-                action = button['action']
-                
-                if action == 'reset':
-                    self.maze.reset_path_visualization()
-                    self.current_metrics = None
-                elif action == 'random':
-                    self.maze.generate_random_maze(wall_probability=0.3)
-                    self.current_metrics = None
-                elif action == 'clear':
-                    self.maze.reset_path_visualization()
-                    self.current_metrics = None
-                else:
-                    self._run_algorithm(action)
-                return
+        button = self._button_at(pos)
+        if button is not None:
+            action = button['action']
+
+            if action == 'reset':
+                self.maze.reset_path_visualization()
+                self.current_metrics = None
+            elif action == 'random':
+                self.maze.generate_random_maze(wall_probability=0.3)
+                self.current_metrics = None
+            elif action == 'clear':
+                self.maze.reset_path_visualization()
+                self.current_metrics = None
+            else:
+                self._run_algorithm(action)
+            self._grid_dirty = True
+            return
         
         # Check grid clicks
         if y >= self.header_height and x < self.grid_width:
@@ -276,15 +400,37 @@ class MazeVisualizer:
             if 0 <= row < self.maze.rows and 0 <= col < self.maze.cols:
                 if (row, col) == self.maze.start or (row, col) == self.maze.end:
                     return
-                
-                # Toggle wall
-                if self.maze.grid[row][col] == CellType.WALL.value:
-                    self.maze.grid[row][col] = CellType.EMPTY.value
-                else:
-                    self.maze.grid[row][col] = CellType.WALL.value
-                
-                self.maze._build_adjacency_list()
-    
+
+                # Toggle wall and start a drag stroke; motion events
+                # extend it until the button is released
+                self.mouse_pressed = True
+                self._drag_toggled = {(row, col)}
+                self.maze.toggle_wall(row, col)
+                self._grid_dirty = True
+
+    def _handle_mouse_drag(self, pos: Tuple[int, int]):
+        """
+        Extend the current wall-drawing drag to the cell under the cursor
+
+        Motion events arrive far faster than the cursor crosses cell
+        boundaries, so cells already flipped this stroke are skipped:
+        each cell toggles at most once per drag no matter how noisy the
+        motion stream is, and every toggle is the O(1) adjacency patch.
+        """
+        x, y = pos
+        if y < self.header_height or x >= self.grid_width:
+            return
+        col = x // self.cell_size
+        row = (y - self.header_height) // self.cell_size
+        cell = (row, col)
+
+        if (0 <= row < self.maze.rows and 0 <= col < self.maze.cols
+                and cell not in self._drag_toggled
+                and cell != self.maze.start and cell != self.maze.end):
+            self._drag_toggled.add(cell)
+            self.maze.toggle_wall(row, col)
+            self._grid_dirty = True
+
     def _draw(self):
         """Draw everything"""
         self.screen.fill(COLORS['bg'])
@@ -301,10 +447,17 @@ class MazeVisualizer:
                     self.running = False
                 elif event.type == pygame.MOUSEBUTTONDOWN and not self.algorithm_running:
                     self._handle_mouse_click(event.pos)
+                elif event.type == pygame.MOUSEMOTION and self.mouse_pressed:
+                    self._handle_mouse_drag(event.pos)
+                elif event.type == pygame.MOUSEBUTTONUP:
+                    self.mouse_pressed = False
+                    self._drag_toggled.clear()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         self.running = False
-            
+
+            if self.algorithm_running:
+                self._drain_steps()
             self._draw()
             pygame.display.flip()
             self.clock.tick(self.fps)
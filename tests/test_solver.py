@@ -36,16 +36,36 @@ class TestMaze(unittest.TestCase):
         self.assertIn((0, 0), self.maze.adjacency_list)
         self.assertTrue(len(self.maze.adjacency_list) > 0)
 
+    def test_toggle_wall_patches_adjacency(self):
+        """Test in-place adjacency patching matches a fresh rebuild"""
+        _ = self.maze.adjacency_list  # build the cache toggle_wall patches
+        # Exercise both branches: (5, 5) becomes a wall, then empty again
+        for row, col in [(5, 5), (5, 6), (0, 3), (9, 9), (5, 5), (4, 5)]:
+            self.maze.toggle_wall(row, col)
+
+        rebuilt = Maze(10, 10)
+        rebuilt.grid = self.maze.grid.copy()
+        expected = rebuilt.adjacency_list
+        patched = self.maze.adjacency_list
+        self.assertEqual(set(patched), set(expected))
+        for cell, neighbors in expected.items():
+            self.assertCountEqual(patched[cell], neighbors)
+
 
 class TestAlgorithms(unittest.TestCase):
     """Test pathfinding algorithms"""
     
-    def setUp(self):
-        """Set up test maze"""
-        self.maze = Maze(5, 5)
-        self.maze.set_start(0, 0)
-        self.maze.set_end(4, 4)
-        self.pathfinder = PathfindingAlgorithms(self.maze)
+    @classmethod
+    def setUpClass(cls):
+        """Set up the shared test maze once for the whole class
+
+        None of these tests mutate the maze, so building it (and its
+        lazily cached adjacency structures) per test only repeats work.
+        """
+        cls.maze = Maze(5, 5)
+        cls.maze.set_start(0, 0)
+        cls.maze.set_end(4, 4)
+        cls.pathfinder = PathfindingAlgorithms(cls.maze)
     
     def test_bfs_finds_path(self):
         """Test BFS finds path"""
@@ -75,6 +95,18 @@ class TestAlgorithms(unittest.TestCase):
         """Test BFS finds optimal path"""
         metrics = self.pathfinder.bfs()
         self.assertTrue(metrics.is_optimal)
+
+    def test_jps_finds_path(self):
+        """Test JPS finds path"""
+        metrics = self.pathfinder.jps()
+        self.assertTrue(metrics.path_found)
+        self.assertTrue(len(metrics.path) > 0)
+
+    def test_jps_optimal(self):
+        """Test JPS path length matches BFS optimal length"""
+        jps_metrics = self.pathfinder.jps()
+        bfs_metrics = self.pathfinder.bfs()
+        self.assertEqual(jps_metrics.path_length, bfs_metrics.path_length)
     
     def test_manhattan_heuristic(self):
         """Test Manhattan distance calculation"""